@@ -8,6 +8,9 @@ from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SRC_DIR = REPO_ROOT / "src"
+# Se resuelven una sola vez al importar: ``src`` puede ser un enlace simbólico y las rutas
+# candidatas se comparan ya resueltas.
+_EXPECTED_ROOTS: frozenset[Path] = frozenset(path.resolve() for path in (REPO_ROOT, SRC_DIR))
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
@@ -33,12 +36,11 @@ def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
-    expected_roots = {REPO_ROOT.resolve(), SRC_DIR.resolve()}
-    artifacts = detect_editable_artifacts(expected_roots)
+    artifacts = detect_editable_artifacts(_EXPECTED_ROOTS)
 
     if args.json:
-        payload = [artifact.to_dict() for artifact in artifacts]
-        print(json.dumps(payload, indent=2, ensure_ascii=False))
+        json.dump([artifact.to_dict() for artifact in artifacts], sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
         return 0
 
     if not artifacts:
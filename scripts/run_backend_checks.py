@@ -5,6 +5,7 @@ from __future__ import annotations
 import shlex
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import Sequence
 
@@ -21,21 +22,27 @@ class TaskResult:
 
 
 COMMANDS: list[tuple[str, Sequence[str]]] = [
-    ("Compilación del código Python", [sys.executable, "-m", "compileall", "src"]),
+    ("Compilación del código Python", [sys.executable, "-m", "compileall", "-j", "0", "-q", "src"]),
     ("Validación de dependencias", [sys.executable, "-m", "pip", "check"]),
 ]
 
 
 def run_task(title: str, command: Sequence[str]) -> TaskResult:
     quoted = " ".join(shlex.quote(part) for part in command)
+    # La salida se captura para que las tareas concurrentes no se mezclen en consola.
+    process = subprocess.run(command, text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
     print(f"\n==> {title}\n$ {quoted}")
-    process = subprocess.run(command, text=True)
+    if process.stdout:
+        print(process.stdout, end="" if process.stdout.endswith("\n") else "\n")
     print(f"-- Resultado: {'OK' if process.returncode == 0 else f'FALLO ({process.returncode})'}")
     return TaskResult(title=title, command=command, returncode=process.returncode)
 
 
 def main() -> None:
-    results = [run_task(title, command) for title, command in COMMANDS]
+    with ThreadPoolExecutor(max_workers=len(COMMANDS)) as executor:
+        futures = {executor.submit(run_task, title, command): index for index, (title, command) in enumerate(COMMANDS)}
+        completed = {futures[future]: future.result() for future in as_completed(futures)}
+    results = [completed[index] for index in range(len(COMMANDS))]
     failures = [result for result in results if not result.succeeded]
 
     print("\nResumen de comprobaciones:")
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import typer
 from rich import box
@@ -19,10 +19,16 @@ from .recorder import AudioRecorder, RecorderConfig, RecorderError
 APP_NAME = "Grabadora Intento 4"
 DEFAULT_DISCLAIMER_EMAIL = "legal@example.com"
 
-app = typer.Typer(no_args_is_help=True, add_completion=False, help=APP_NAME)
-licencia_app = typer.Typer(help="Herramientas para gestionar licencias.")
-app.add_typer(licencia_app, name="licencia")
-console = Console()
+_console: Console | None = None
+
+
+def _get_console() -> Console:
+    """Devuelve la consola compartida; se crea en el primer uso para no sondear el terminal al importar."""
+
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
 
 
 def _print_payload(payload: LicensePayload) -> None:
@@ -34,10 +40,9 @@ def _print_payload(payload: LicensePayload) -> None:
     table.add_row("Producto", payload.product)
     table.add_row("Emitida", payload.issued_at.isoformat())
     table.add_row("Expira", payload.expires_at.isoformat())
-    console.print(table)
+    _get_console().print(table)
 
 
-@app.command()
 def disclaimer(
     nombre_producto: str = typer.Option(APP_NAME, "--producto", help="Nombre comercial del producto."),
     responsable: str = typer.Option("Grabadora Team", "--responsable", help="Responsable legal."),
@@ -45,10 +50,9 @@ def disclaimer(
 ) -> None:
     """Muestra el descargo de responsabilidad estándar."""
 
-    console.print(build_disclaimer(organization=responsable, product_name=nombre_producto, contact_email=correo))
+    _get_console().print(build_disclaimer(organization=responsable, product_name=nombre_producto, contact_email=correo))
 
 
-@app.command()
 def grabar(
     salida: Path = typer.Option(..., exists=False, dir_okay=False, writable=True, help="Ruta del archivo WAV de salida."),
     duracion: Optional[float] = typer.Option(None, min=0.0, help="Duración deseada en segundos."),
@@ -84,6 +88,7 @@ def grabar(
         contact_email=DEFAULT_DISCLAIMER_EMAIL,
     )
 
+    console = _get_console()
     console.rule("Condiciones de uso")
     console.print(disclaimer_text)
 
@@ -113,23 +118,25 @@ def grabar(
         raise typer.Exit(code=1) from error
 
 
-@licencia_app.command("emitir")
 def emitir(
     nombre: str = typer.Option(..., prompt="Nombre completo", help="Nombre del licenciatario."),
     correo: str = typer.Option(..., prompt="Correo electrónico", help="Correo del licenciatario."),
     dias: int = typer.Option(30, min=1, help="Días de validez."),
     clave_secreta: str = typer.Option(..., prompt=True, hide_input=True, confirmation_prompt=True),
-    salida: Path = typer.Option(Path("licencia.json"), help="Archivo donde se guardará la licencia."),
+    salida: Path = typer.Option("licencia.json", help="Archivo donde se guardará la licencia."),
+    algoritmo: str = typer.Option("hmac-sha256", help="Algoritmo de firma: hmac-sha256 o blake3."),
 ) -> None:
     """Emite una nueva licencia firmada."""
 
     payload = LicensePayload.issue(name=nombre, email=correo, product=APP_NAME, validity_days=dias)
-    manager = LicenseManager(secret_key=clave_secreta, product_name=APP_NAME)
+    try:
+        manager = LicenseManager(secret_key=clave_secreta, product_name=APP_NAME, hash_algorithm=algoritmo)
+    except ValueError as error:
+        raise typer.BadParameter(str(error), param_hint="--algoritmo") from error
     manager.issue_license_file(payload, output_path=salida)
-    console.print(f"[bold green]Licencia emitida correctamente en[/bold green] {salida}")
+    _get_console().print(f"[bold green]Licencia emitida correctamente en[/bold green] {salida}")
 
 
-@licencia_app.command("verificar")
 def verificar(
     archivo: Path = typer.Option(..., exists=True, dir_okay=False, readable=True, help="Archivo de licencia."),
     clave_secreta: str = typer.Option(..., prompt=True, hide_input=True),
@@ -144,7 +151,6 @@ def verificar(
     _print_payload(payload)
 
 
-@licencia_app.command("revocar")
 def revocar(
     archivo: Path = typer.Option(..., exists=True, dir_okay=False, writable=True, help="Archivo de licencia."),
 ) -> None:
@@ -153,8 +159,34 @@ def revocar(
     manager = LicenseManager(secret_key="placeholder", product_name=APP_NAME)
     # No necesitamos validar la firma para eliminar el archivo; se utiliza una clave dummy.
     manager.revoke(archivo)
-    console.print(f"[bold yellow]Licencia revocada y archivo eliminado:[/bold yellow] {archivo}")
+    _get_console().print(f"[bold yellow]Licencia revocada y archivo eliminado:[/bold yellow] {archivo}")
+
+
+def _build_app() -> typer.Typer:
+    """Construye la aplicación Typer; solo se invoca al usarla como CLI."""
+
+    app = typer.Typer(no_args_is_help=True, add_completion=False, help=APP_NAME)
+    licencia_app = typer.Typer(help="Herramientas para gestionar licencias.")
+    app.add_typer(licencia_app, name="licencia")
+
+    app.command()(disclaimer)
+    app.command()(grabar)
+    licencia_app.command("emitir")(emitir)
+    licencia_app.command("verificar")(verificar)
+    licencia_app.command("revocar")(revocar)
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    # ``app`` se crea bajo demanda (PEP 562) para que importar el módulo no registre comandos.
+    if name == "app":
+        app = _build_app()
+        globals()["app"] = app
+        return app
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":  # pragma: no cover
-    app()
+    _build_app()()
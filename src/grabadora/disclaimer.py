@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 from textwrap import dedent
 from typing import Iterable
 
@@ -12,6 +13,33 @@ DEFAULT_POINTS: tuple[str, ...] = (
     "Las transcripciones generadas a partir del audio son responsabilidad exclusiva del usuario.",
 )
 
+_SEPARATOR = "=" * 72
+
+_FOOTER = dedent(
+    """
+    IMPORTANTE: La instalación y/o uso continuo de esta herramienta implica
+    la aceptación íntegra de este descargo de responsabilidad. Si no está de
+    acuerdo, desinstale el software inmediatamente.
+    """
+).strip()
+
+_CONTACT_TEMPLATE = (
+    "\n\nPara cualquier consulta relacionada con el uso de la aplicación,\n"
+    "escríbanos a: {email}"
+)
+
+_TEMPLATE = (
+    "{header} - DESCARGO DE RESPONSABILIDAD LEGAL\n"
+    "{separator}\n"
+    "Fecha de generación: {generated_at} UTC\n"
+    "Titular de la licencia: {organization}\n"
+    "\n"
+    "Al continuar, usted declara que entiende y acepta los siguientes puntos:\n"
+    "{bullets}{contact}\n"
+    "\n"
+    "{footer}"
+)
+
 
 def build_disclaimer(
     *,
@@ -32,41 +60,32 @@ def build_disclaimer(
         Cadena de texto con formato listo para mostrarse al usuario.
     """
 
-    lines: list[str] = [
-        f"{product_name.upper()} - DESCARGO DE RESPONSABILIDAD LEGAL",
-        "=" * 72,
-        f"Fecha de generación: {datetime.utcnow():%Y-%m-%d %H:%M UTC}",
-        f"Titular de la licencia: {organization}",
-        "",
-        "Al continuar, usted declara que entiende y acepta los siguientes puntos:",
-    ]
-
-    bullet_points = list(DEFAULT_POINTS)
-    if extra_points:
-        bullet_points.extend(point.strip() for point in extra_points if point.strip())
-
-    for idx, point in enumerate(bullet_points, start=1):
-        lines.append(f"  {idx}. {point}")
-
-    if contact_email:
-        lines.extend(
-            [
-                "",
-                "Para cualquier consulta relacionada con el uso de la aplicación,",
-                f"escríbanos a: {contact_email}",
-            ]
-        )
-
-    lines.append("")
-    lines.append(dedent(
-        """
-        IMPORTANTE: La instalación y/o uso continuo de esta herramienta implica
-        la aceptación íntegra de este descargo de responsabilidad. Si no está de
-        acuerdo, desinstale el software inmediatamente.
-        """
-    ).strip())
-
-    return "\n".join(lines)
+    # La fecha se agrupa por minuto para que las llamadas repetidas reutilicen la caché.
+    generated_at = f"{datetime.utcnow():%Y-%m-%d %H:%M}"
+    points = tuple(extra_points) if extra_points else ()
+    return _build_disclaimer(organization, product_name, contact_email, points, generated_at)
+
+
+@lru_cache(maxsize=32)
+def _build_disclaimer(
+    organization: str,
+    product_name: str,
+    contact_email: str | None,
+    extra_points: tuple[str, ...],
+    generated_at: str,
+) -> str:
+    points = DEFAULT_POINTS + tuple(point.strip() for point in extra_points if point.strip())
+    bullets = "\n".join(f"  {idx}. {point}" for idx, point in enumerate(points, start=1))
+    contact = _CONTACT_TEMPLATE.format(email=contact_email) if contact_email else ""
+    return _TEMPLATE.format(
+        header=product_name.upper(),
+        separator=_SEPARATOR,
+        generated_at=generated_at,
+        organization=organization,
+        bullets=bullets,
+        contact=contact,
+        footer=_FOOTER,
+    )
 
 
 __all__ = ["build_disclaimer", "DEFAULT_POINTS"]
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import queue
 import threading
 import wave
 from pathlib import Path
@@ -27,12 +26,15 @@ except Exception as exc:  # pragma: no cover - entorno sin Tk
 from .disclaimer import build_disclaimer
 from .recorder import RecorderConfig, RecorderError
 
-_SAMPLE_WIDTHS = {
-    "int16": 2,
-    "int32": 4,
-    "float32": 4,
-    "uint8": 1,
-}
+_PRODUCT_NAME = "Grabadora Intento 4"
+_ORGANIZATION = "Grabadora Team"
+_CONTACT_EMAIL = "legal@example.com"
+_BOLD_FONT = ("Segoe UI", 10, "bold")
+# Intervalo mínimo entre refrescos del estado en la ventana.
+_UI_REFRESH_MS = 200
+
+# Bloques leídos que se acumulan antes de volcarlos al WAV.
+_FLUSH_BLOCKS = 8
 
 
 class _GuiRecorder:
@@ -56,8 +58,8 @@ class _GuiRecorder:
         self._thread: threading.Thread | None = None
         self._stream: sd.RawInputStream | None = None  # type: ignore[name-defined]
         self._wave_file: wave.Wave_write | None = None
-        self._queue: "queue.Queue[bytes]" = queue.Queue()
         self._frames_written = 0
+        self._bytes_per_frame = 0
         self._frame_target: int | None = None
         self._output_path: Path | None = None
 
@@ -67,31 +69,32 @@ class _GuiRecorder:
                 "No se pudo inicializar el backend de audio. Instala PortAudio o revisa tus dispositivos."
             ) from _IMPORT_ERROR
 
-    def _writer_loop(self) -> None:
+    def _capture_loop(self) -> None:
         try:
-            sample_width = _SAMPLE_WIDTHS.get(self.config.dtype)
-            if sample_width is None:
-                raise RecorderError(f"Formato de muestra no soportado: {self.config.dtype}")
-
-            bytes_per_frame = self.config.channels * sample_width
-            while True:
-                if self._stop_event.is_set() and self._queue.empty():
-                    break
-                try:
-                    chunk = self._queue.get(timeout=0.1)
-                except queue.Empty:
-                    continue
-
-                if not self._wave_file:
-                    continue
-
-                self._wave_file.writeframes(chunk)
-                self._frames_written += len(chunk) // bytes_per_frame
+            stream = self._stream
+            wave_file = self._wave_file
+            block_size = self.config.block_size
+            bytes_per_frame = self._bytes_per_frame
+            flush_size = block_size * bytes_per_frame * _FLUSH_BLOCKS
+            pending = bytearray()
+            # Lectura bloqueante: PortAudio acumula el audio en su propio búfer y el hilo
+            # de tiempo real nunca ejecuta código Python ni compite por el GIL.
+            while not self._stop_event.is_set():
+                data, overflowed = stream.read(block_size)
+                if overflowed:
+                    self._status_callback("desbordamiento de entrada; se perdieron muestras de audio")
+                pending += data
+                self._frames_written += len(data) // bytes_per_frame
+                if len(pending) >= flush_size:
+                    # ``writeframesraw`` no reescribe la cabecera; ``close()`` la corrige al final.
+                    wave_file.writeframesraw(pending)
+                    pending.clear()
                 self._progress_callback(self._frames_written)
 
                 if self._frame_target is not None and self._frames_written >= self._frame_target:
                     self._stop_event.set()
-                    break
+            if pending:
+                wave_file.writeframesraw(pending)
         except Exception as error:  # pragma: no cover - ruta excepcional
             self._error_callback(error)
             self._output_path = None
@@ -108,7 +111,9 @@ class _GuiRecorder:
 
         self._ensure_backend()
 
-        self._output_path = output_path.expanduser().resolve()
+        # Las rutas del diálogo ya son absolutas; ``resolve()`` solo hace falta para las relativas.
+        output_path = output_path.expanduser()
+        self._output_path = output_path if output_path.is_absolute() else output_path.resolve()
         self._output_path.parent.mkdir(parents=True, exist_ok=True)
         self._frames_written = 0
         self._frame_target = (
@@ -116,22 +121,15 @@ class _GuiRecorder:
         )
         self._stop_event.clear()
 
-        sample_width = _SAMPLE_WIDTHS.get(self.config.dtype)
-        if sample_width is None:
-            raise RecorderError(f"Formato de muestra no soportado: {self.config.dtype}")
+        sample_width = self.config.sample_width
 
         self._wave_file = wave.open(str(self._output_path), "wb")
         self._wave_file.setnchannels(self.config.channels)
         self._wave_file.setsampwidth(sample_width)
         self._wave_file.setframerate(self.config.sample_rate)
 
-        bytes_per_frame = self.config.channels * sample_width
-
-        def _callback(indata: bytes, frames: int, _time, status) -> None:  # pragma: no cover - callback externo
-            if status:
-                self._status_callback(str(status))
-            if not self._stop_event.is_set():
-                self._queue.put(bytes(indata))
+        # Se calcula una vez por grabación; el hilo lector lo reutiliza en cada bloque.
+        self._bytes_per_frame = bytes_per_frame = self.config.bytes_per_frame
 
         self._stream = sd.RawInputStream(  # type: ignore[call-arg]
             samplerate=self.config.sample_rate,
@@ -139,12 +137,12 @@ class _GuiRecorder:
             dtype=self.config.dtype,
             blocksize=self.config.block_size,
             device=self.config.device,
-            callback=_callback,
         )
 
-        self._thread = threading.Thread(target=self._writer_loop, daemon=True)
-        self._thread.start()
+        # El flujo debe estar activo antes de que el hilo lector empiece a llamar a ``read``.
         self._stream.start()
+        self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._thread.start()
 
         # Primer aviso de progreso para mostrar 0 segundos transcurridos.
         if bytes_per_frame:
@@ -169,23 +167,17 @@ class _GuiRecorder:
             finally:
                 self._wave_file = None
 
-        # Vaciar cualquier dato pendiente del queue
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:  # pragma: no cover - protección adicional
-                break
-
 
 class RecorderApp(tk.Tk):
     """Aplicación Tkinter con controles sencillos."""
 
     def __init__(self) -> None:
         super().__init__()
-        self.title("Grabadora Intento 4")
+        self.title(_PRODUCT_NAME)
         self.resizable(False, False)
 
         self._config = RecorderConfig()
+        self._inv_sample_rate = 1.0 / self._config.sample_rate if self._config.sample_rate else 0.0
         self._recorder = _GuiRecorder(
             self._config,
             progress_callback=self._on_progress,
@@ -198,6 +190,8 @@ class RecorderApp(tk.Tk):
         self._is_recording = False
         self._frames_recorded = 0
         self._had_error = False
+        self._progress_pending = False
+        self._pending_status: str | None = None
 
     def _create_widgets(self) -> None:
         padding = {"padx": 10, "pady": 5}
@@ -205,13 +199,14 @@ class RecorderApp(tk.Tk):
         wrapper = ttk.Frame(self)
         wrapper.grid(row=0, column=0, sticky="nsew", **padding)
 
+        # ``build_disclaimer`` está memoizado, así que reabrir la ventana reutiliza el texto.
         disclaimer_text = build_disclaimer(
-            organization="Grabadora Team",
-            product_name="Grabadora Intento 4",
-            contact_email="legal@example.com",
+            organization=_ORGANIZATION,
+            product_name=_PRODUCT_NAME,
+            contact_email=_CONTACT_EMAIL,
         )
 
-        ttk.Label(wrapper, text="Descargo de responsabilidad", font=("Segoe UI", 10, "bold")).grid(
+        ttk.Label(wrapper, text="Descargo de responsabilidad", font=_BOLD_FONT).grid(
             row=0, column=0, columnspan=3, sticky="w"
         )
 
@@ -241,7 +236,7 @@ class RecorderApp(tk.Tk):
         )
 
         self.status_var = tk.StringVar(value="Esperando para grabar")
-        ttk.Label(wrapper, textvariable=self.status_var, font=("Segoe UI", 10, "bold")).grid(
+        ttk.Label(wrapper, textvariable=self.status_var, font=_BOLD_FONT).grid(
             row=6, column=0, columnspan=3, sticky="w", pady=(10, 0)
         )
 
@@ -309,9 +304,19 @@ class RecorderApp(tk.Tk):
         self.status_var.set("Finalizando grabación, espera un momento...")
 
     def _on_progress(self, frames: int) -> None:
+        # Se llama desde el hilo escritor en cada bloque; solo se programa un refresco a la vez.
         self._frames_recorded = frames
-        seconds = frames / self._config.sample_rate if self._config.sample_rate else 0
-        self.after(0, lambda: self.status_var.set(f"Grabando... {seconds:.1f} segundos"))
+        if self._progress_pending:
+            return
+        self._progress_pending = True
+        self.after(_UI_REFRESH_MS, self._flush_progress)
+
+    def _flush_progress(self) -> None:
+        self._progress_pending = False
+        if not self._is_recording:
+            return
+        seconds = self._frames_recorded * self._inv_sample_rate
+        self.status_var.set(f"Grabando... {seconds:.1f} segundos")
 
     def _on_finished(self, output: Path | None, interrupted: bool) -> None:
         def _update() -> None:
@@ -323,10 +328,10 @@ class RecorderApp(tk.Tk):
                 self.warning_var.set("")
                 return
             if output and not interrupted:
-                seconds = self._frames_recorded / self._config.sample_rate if self._config.sample_rate else 0
+                seconds = self._frames_recorded * self._inv_sample_rate
                 self.status_var.set(f"Grabación guardada en {output} ({seconds:.1f} s)")
             elif output and interrupted:
-                seconds = self._frames_recorded / self._config.sample_rate if self._config.sample_rate else 0
+                seconds = self._frames_recorded * self._inv_sample_rate
                 self.status_var.set(f"Grabación detenida manualmente. Archivo guardado en {output} ({seconds:.1f} s)")
             else:
                 self.status_var.set("Grabación cancelada")
@@ -347,7 +352,15 @@ class RecorderApp(tk.Tk):
         self.after(0, _notify)
 
     def _on_status(self, message: str) -> None:
-        self.after(0, lambda: self.warning_var.set(f"Aviso del dispositivo: {message}"))
+        scheduled = self._pending_status is not None
+        self._pending_status = message
+        if not scheduled:
+            self.after(_UI_REFRESH_MS, self._flush_status)
+
+    def _flush_status(self) -> None:
+        message, self._pending_status = self._pending_status, None
+        if message is not None:
+            self.warning_var.set(f"Aviso del dispositivo: {message}")
 
 
 def run() -> None:
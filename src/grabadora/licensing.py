@@ -2,15 +2,55 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 import hashlib
 import hmac
 import json
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Final
+from typing import Any, Callable, Final, Literal
+
+try:  # pragma: no cover - dependencia opcional
+    import orjson
+except ImportError:  # pragma: no cover - se usa la biblioteca estándar
+    orjson = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - dependencia opcional
+    import blake3
+except ImportError:  # pragma: no cover - solo se admite HMAC-SHA256
+    blake3 = None  # type: ignore[assignment]
 
 _LICENSE_HASH_ALGORITHM: Final = "sha256"
+# Algoritmos de firma admitidos; el primero es el histórico y no se anota en el archivo.
+SignatureAlgorithm = Literal["hmac-sha256", "blake3"]
+_DEFAULT_SIGNATURE_ALGORITHM: Final = "hmac-sha256"
+_SIGNATURE_ALGORITHMS: Final = ("hmac-sha256", "blake3")
+# Longitud de las firmas hexadecimales que se emitían antes de pasar a base64.
+_LEGACY_HEX_SIGNATURE_LENGTH: Final = 64
+# Codificador canónico reutilizable: las firmas existentes dependen de estos bytes exactos
+# (claves ordenadas, sin espacios y con escapes ASCII), por eso no se delega en orjson.
+_CANONICAL_ENCODER: Final = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
+def _decode_signature(signature: str) -> bytes:
+    """Convierte la firma del archivo a bytes; admite base64 y el hexadecimal heredado."""
+
+    try:
+        if len(signature) == _LEGACY_HEX_SIGNATURE_LENGTH:
+            return bytes.fromhex(signature)
+        return base64.b64decode(signature, validate=True)
+    except (ValueError, binascii.Error):
+        return b""
+
+
+def _utc_isoformat(value: datetime) -> str:
+    # Las fechas emitidas por ``LicensePayload.issue`` ya están en UTC; solo se convierten las demás.
+    if value.tzinfo is timezone.utc:
+        return value.isoformat()
+    return value.astimezone(timezone.utc).isoformat()
 
 
 class LicenseVerificationError(RuntimeError):
@@ -26,13 +66,18 @@ class LicensePayload:
     issued_at: datetime
     expires_at: datetime
     product: str
+    # Marca de expiración en segundos de época, para comprobarla sin construir objetos ``datetime``.
+    expires_epoch: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.expires_epoch = self.expires_at.timestamp()
 
     def to_dict(self) -> dict[str, Any]:
         return {
             "name": self.name,
             "email": self.email,
-            "issued_at": self.issued_at.astimezone(timezone.utc).isoformat(),
-            "expires_at": self.expires_at.astimezone(timezone.utc).isoformat(),
+            "issued_at": _utc_isoformat(self.issued_at),
+            "expires_at": _utc_isoformat(self.expires_at),
             "product": self.product,
         }
 
@@ -66,49 +111,117 @@ class LicensePayload:
 class LicenseManager:
     """Emite y verifica licencias mediante firmas HMAC."""
 
-    def __init__(self, *, secret_key: str, product_name: str) -> None:
+    def __init__(
+        self,
+        *,
+        secret_key: str,
+        product_name: str,
+        hash_algorithm: SignatureAlgorithm = _DEFAULT_SIGNATURE_ALGORITHM,
+    ) -> None:
         if not secret_key:
             raise ValueError("La clave secreta no puede estar vacía.")
         if not product_name:
             raise ValueError("El nombre del producto no puede estar vacío.")
+        if hash_algorithm not in _SIGNATURE_ALGORITHMS:
+            raise ValueError(f"Algoritmo de firma no soportado: {hash_algorithm}")
+        if hash_algorithm == "blake3" and blake3 is None:
+            raise ValueError("El algoritmo blake3 requiere instalar el paquete 'blake3'.")
 
         self._secret_key = secret_key.encode("utf-8")
         self._product_name = product_name
+        self._product_bytes = product_name.encode("utf-8")
+        self._hash_algorithm = hash_algorithm
+        # Firmantes especializados por algoritmo; el de verificación de otros algoritmos se crea al usarlo.
+        self._signers: dict[str, Callable[[dict[str, Any]], bytes]] = {
+            hash_algorithm: self._make_signer(hash_algorithm, self._secret_key)
+        }
 
     @staticmethod
-    def _sign(payload: dict[str, Any], secret_key: bytes) -> str:
-        message = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
-        signature = hmac.new(secret_key, message, getattr(hashlib, _LICENSE_HASH_ALGORITHM)).hexdigest()
-        return signature
+    def _make_signer(algorithm: str, secret_key: bytes) -> Callable[[dict[str, Any]], bytes]:
+        """Crea una función de firma con la clave y el codificador ya resueltos."""
+
+        encode = _CANONICAL_ENCODER.encode
+        if algorithm == "blake3":
+            # El modo con clave de BLAKE3 exige exactamente 32 bytes y hace una sola pasada.
+            key = hashlib.sha256(secret_key).digest()
+            hasher = blake3.blake3
+
+            def _sign_blake3(payload: dict[str, Any]) -> bytes:
+                return hasher(encode(payload).encode("utf-8"), key=key).digest()
+
+            return _sign_blake3
+
+        # La plantilla ya tiene la clave absorbida; ``copy()`` evita repetir ese trabajo en cada firma.
+        template = hmac.new(secret_key, digestmod=_LICENSE_HASH_ALGORITHM)
+
+        def _sign_hmac(payload: dict[str, Any]) -> bytes:
+            signer = template.copy()
+            signer.update(encode(payload).encode("utf-8"))
+            return signer.digest()
+
+        return _sign_hmac
+
+    def _signer_for(self, algorithm: str) -> Callable[[dict[str, Any]], bytes]:
+        signer = self._signers.get(algorithm)
+        if signer is None:
+            signer = self._signers[algorithm] = self._make_signer(algorithm, self._secret_key)
+        return signer
 
     def issue_license(self, payload: LicensePayload) -> dict[str, Any]:
         data = payload.to_dict()
-        signature = self._sign(data, self._secret_key)
-        data["signature"] = signature
+        if self._hash_algorithm != _DEFAULT_SIGNATURE_ALGORITHM:
+            # El algoritmo forma parte de lo firmado, así que no puede alterarse sin invalidar la firma.
+            data["algorithm"] = self._hash_algorithm
+        # Base64 ocupa 44 caracteres frente a los 64 del hexadecimal.
+        data["signature"] = base64.b64encode(self._signers[self._hash_algorithm](data)).decode("ascii")
         return data
 
     def issue_license_file(self, payload: LicensePayload, *, output_path: Path) -> Path:
         data = self.issue_license(payload)
-        output_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            output_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
         return output_path
 
     def verify_file(self, path: Path) -> LicensePayload:
-        if not path.exists():
-            raise LicenseVerificationError(f"No se encontró el archivo de licencia: {path}")
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            raise LicenseVerificationError(f"No se encontró el archivo de licencia: {path}") from None
+
+        # ``json.loads`` acepta bytes UTF-8 directamente, sin decodificar antes a ``str``.
+        try:
+            raw = json.loads(content)
+        except ValueError as exc:
+            raise LicenseVerificationError("El archivo de licencia no es un JSON válido.") from exc
+        if not isinstance(raw, dict):
+            raise LicenseVerificationError("El archivo de licencia no es un JSON válido.")
 
-        raw = json.loads(path.read_text(encoding="utf-8"))
         signature = raw.pop("signature", None)
-        if not signature:
+        if not signature or not isinstance(signature, str):
             raise LicenseVerificationError("El archivo de licencia no contiene firma.")
 
-        expected_signature = self._sign(raw, self._secret_key)
-        if not hmac.compare_digest(signature, expected_signature):
+        algorithm = raw.get("algorithm", _DEFAULT_SIGNATURE_ALGORITHM)
+        if algorithm not in _SIGNATURE_ALGORITHMS:
+            raise LicenseVerificationError(f"Algoritmo de firma no soportado: {algorithm}")
+        if algorithm == "blake3" and blake3 is None:
+            raise LicenseVerificationError("La licencia usa blake3 y el paquete 'blake3' no está instalado.")
+
+        expected_signature = self._signer_for(algorithm)(raw)
+        # Las dos comparaciones se ejecutan siempre y en tiempo constante antes de decidir,
+        # de modo que el tiempo de respuesta no revela cuál de ellas falló.
+        product = str(raw.get("product", "")).encode("utf-8")
+        bad = 0
+        bad |= 0 if hmac.compare_digest(_decode_signature(signature), expected_signature) else 1
+        bad |= 0 if hmac.compare_digest(product, self._product_bytes) else 2
+        if bad & 1:
             raise LicenseVerificationError("La firma del archivo de licencia no es válida.")
+        if bad:
+            raise LicenseVerificationError("La licencia no corresponde a este producto.")
 
         payload = LicensePayload.from_dict(raw)
-        if payload.product != self._product_name:
-            raise LicenseVerificationError("La licencia no corresponde a este producto.")
-        if datetime.now(tz=timezone.utc) > payload.expires_at:
+        if time.time() > payload.expires_epoch:
             raise LicenseVerificationError("La licencia ha expirado.")
 
         return payload
@@ -126,4 +239,5 @@ __all__ = [
     "LicenseManager",
     "LicensePayload",
     "LicenseVerificationError",
+    "SignatureAlgorithm",
 ]
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import contextlib
-import queue
-import time
+import math
+import os
+import threading
 import wave
+from collections import deque
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable, NamedTuple
 
 from rich.console import Console
 from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
@@ -26,6 +29,12 @@ class RecorderError(RuntimeError):
     """Error al configurar o ejecutar la captura de audio."""
 
 
+class _StatusMessage(NamedTuple):
+    """Aviso del backend que el callback encola para que lo muestre el hilo escritor."""
+
+    status: Any
+
+
 @dataclass(slots=True)
 class RecorderConfig:
     """Configuración avanzada para la sesión de grabación."""
@@ -41,6 +50,14 @@ class RecorderConfig:
     def block_size(self) -> int:
         return max(1, int(self.sample_rate * (self.block_duration_ms / 1000)))
 
+    @property
+    def sample_width(self) -> int:
+        return _resolve_sample_width(self.dtype)
+
+    @property
+    def bytes_per_frame(self) -> int:
+        return self.channels * self.sample_width
+
 
 _SAMPLE_WIDTHS = {
     "int16": 2,
@@ -50,6 +67,69 @@ _SAMPLE_WIDTHS = {
 }
 
 
+@cache
+def _resolve_sample_width(dtype: str) -> int:
+    # Los formatos válidos quedan memorizados; los inválidos no se cachean y vuelven a fallar.
+    try:
+        return _SAMPLE_WIDTHS[dtype]
+    except KeyError as exc:  # pragma: no cover - depende de la configuración
+        raise RecorderError(f"Formato de muestra no soportado: {dtype}") from exc
+
+# Tamaño del búfer del archivo WAV y del lote de bloques que se vuelca en cada escritura.
+_FILE_BUFFER_SIZE = 1 << 17
+_FLUSH_BYTES = 1 << 18
+# Bloques preasignados que pueden quedar pendientes entre el callback y el escritor.
+_RING_SLOTS = 256
+# Tamaño del búfer del medidor cuando PortAudio elige el tamaño de bloque (``block_size=0``).
+_METER_FALLBACK_FRAMES = 4096
+# Cabecera RIFF/WAVE PCM que escribe ``wave``.
+_WAV_HEADER_SIZE = 44
+# Segundos mínimos entre refrescos de la barra de progreso.
+_PROGRESS_INTERVAL = 0.1
+
+# Código de ``memoryview.cast`` y valor de fondo de escala para el medidor de pico.
+_PEAK_FORMATS = {
+    "int16": ("h", 32_768),
+    "int32": ("i", 2_147_483_648),
+}
+
+
+# Prioridad del hilo escritor: SCHED_FIFO en Linux, THREAD_PRIORITY_HIGHEST en Windows.
+_WRITER_FIFO_PRIORITY = 10
+_WINDOWS_THREAD_PRIORITY_HIGHEST = 2
+
+
+def _raise_thread_priority() -> None:
+    """Sube la prioridad del hilo actual si el sistema lo permite; si no, no hace nada."""
+
+    try:
+        if hasattr(os, "sched_setscheduler"):
+            # En Linux el pid 0 se refiere al hilo que llama; requiere CAP_SYS_NICE.
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(_WRITER_FIFO_PRIORITY))
+        elif os.name == "nt":  # pragma: no cover - solo Windows
+            import ctypes
+
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), _WINDOWS_THREAD_PRIORITY_HIGHEST)
+    except (OSError, AttributeError):
+        pass
+
+
+def _peak_level(chunk: bytes | memoryview, dtype: str) -> str:
+    """Devuelve el pico del bloque en dBFS, o cadena vacía si el formato no se mide."""
+
+    spec = _PEAK_FORMATS.get(dtype)
+    if spec is None or not chunk:
+        return ""
+    code, full_scale = spec
+    # ``max``/``min`` recorren la vista en C, sin copiar el bloque ni depender de NumPy.
+    samples = memoryview(chunk).cast(code)
+    peak = max(max(samples), -min(samples))
+    if peak == 0:
+        return "pico  -inf dBFS"
+    return f"pico {20 * math.log10(peak / full_scale):5.1f} dBFS"
+
+
 class AudioRecorder:
     """Grabador optimizado que escribe el audio directamente en disco."""
 
@@ -63,12 +143,6 @@ class AudioRecorder:
                 "No se pudo importar sounddevice. Instala las dependencias de audio necesarias"
             ) from _IMPORT_ERROR
 
-    def _get_sample_width(self) -> int:
-        try:
-            return _SAMPLE_WIDTHS[self.config.dtype]
-        except KeyError as exc:  # pragma: no cover - depende de la configuración
-            raise RecorderError(f"Formato de muestra no soportado: {self.config.dtype}") from exc
-
     def record_to_file(
         self,
         output_path: Path,
@@ -83,7 +157,7 @@ class AudioRecorder:
         output_path = output_path.expanduser().resolve()
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        sample_width = self._get_sample_width()
+        sample_width = self.config.sample_width
         frame_count_target = None
         if duration_seconds:
             frame_count_target = int(duration_seconds * self.config.sample_rate)
@@ -99,12 +173,40 @@ class AudioRecorder:
         if banner:
             self.console.print(banner)
 
-        q: "queue.Queue[bytes]" = queue.Queue()
+        # ``deque.append``/``popleft`` son atómicos bajo el GIL: el callback no toma ningún candado
+        # y el evento solo despierta al escritor, que vacía todo lo acumulado de una vez.
+        # Por la cola solo viajan índices de un anillo de bloques preasignados; ``free`` devuelve
+        # al callback los que el escritor ya copió, así que no se reserva memoria por bloque.
+        slot_size = self.config.block_size * self.config.bytes_per_frame
+        ring = [bytearray(slot_size) for _ in range(_RING_SLOTS)]
+        sizes = [0] * _RING_SLOTS
+        free: deque[int] = deque(range(_RING_SLOTS))
+        q: deque[int | _StatusMessage] = deque()
+        have_data = threading.Event()
+        stopped = threading.Event()
 
         def _callback(indata: bytes, frames: int, _time, status) -> None:  # pragma: no cover - callback externo
             if status:
-                self.console.log(f"[yellow]Advertencia del backend de audio:[/yellow] {status}")
-            q.put(bytes(indata))
+                # El hilo de tiempo real no formatea ni escribe en consola: solo encola el aviso.
+                q.append(_StatusMessage(status))
+                have_data.set()
+            if stopped.is_set():
+                return
+            try:
+                slot = free.popleft()
+            except IndexError:
+                q.append(_StatusMessage("el disco no da abasto; se descartó un bloque de audio"))
+                have_data.set()
+                return
+            # El búfer de CFFI solo es válido durante el callback, así que se copia al bloque reservado;
+            # una vez alcanzado el objetivo ya no se copian los bloques que nadie va a escribir.
+            size = len(indata)
+            if size > len(ring[slot]):
+                ring[slot] = bytearray(size)
+            memoryview(ring[slot])[:size] = indata
+            sizes[slot] = size
+            q.append(slot)
+            have_data.set()
 
         with contextlib.ExitStack() as stack:
             stream = sd.RawInputStream(
@@ -116,46 +218,117 @@ class AudioRecorder:
                 callback=_callback,
             )
             stack.enter_context(stream)
-            wave_file = wave.open(str(output_path), "wb")
+            # ``wave`` no cierra archivos que no abrió: el ExitStack cierra primero el WAV
+            # (corrigiendo la cabecera) y después el archivo con búfer amplio.
+            raw_file = stack.enter_context(open(output_path, "wb", buffering=_FILE_BUFFER_SIZE))
+            bytes_per_frame = self.config.bytes_per_frame
+            if frame_count_target and hasattr(os, "posix_fallocate"):
+                # Con duración conocida se reserva el espacio de una vez para evitar que el
+                # sistema de archivos fragmente la grabación; al cerrar se recorta a lo escrito.
+                with contextlib.suppress(OSError):
+                    os.posix_fallocate(
+                        raw_file.fileno(), 0, _WAV_HEADER_SIZE + frame_count_target * bytes_per_frame
+                    )
+                    stack.callback(raw_file.truncate)
+            wave_file = wave.open(raw_file, "wb")
             stack.enter_context(contextlib.closing(wave_file))
             wave_file.setnchannels(self.config.channels)
             wave_file.setsampwidth(sample_width)
             wave_file.setframerate(self.config.sample_rate)
 
-            bytes_per_frame = self.config.channels * sample_width
             frames_written = 0
+            # Copia del último bloque para el medidor, en un búfer fijo: asignar un corte del mismo
+            # tamaño nunca lo redimensiona, así que la lectura desde el hilo principal es segura.
+            meter_buf = bytearray(slot_size or _METER_FALLBACK_FRAMES * bytes_per_frame)
+            meter_len = 0
+            writer_error: BaseException | None = None
+            closing = threading.Event()
+            writer_done = threading.Event()
+
+            def _writer() -> None:
+                # Hilo dedicado a disco: la captura no depende de lo que tarde el refresco de la consola.
+                nonlocal frames_written, meter_len, writer_error
+                _raise_thread_priority()
+                pending = bytearray()
+                try:
+                    while True:
+                        have_data.wait(timeout=0.5)
+                        have_data.clear()
+                        # Se lee antes de vaciar: si ya estaba activo, ``stop()`` ha retornado y no
+                        # llegan más bloques, así que tras este vaciado la cola queda vacía de verdad.
+                        done = closing.is_set()
+                        while q:
+                            item = q.popleft()
+                            if isinstance(item, _StatusMessage):
+                                self.console.log(f"[yellow]Advertencia del backend de audio:[/yellow] {item.status}")
+                                continue
+                            chunk = memoryview(ring[item])[: sizes[item]]
+                            pending += chunk
+                            # El medidor lee desde otro hilo: se copia antes de devolver la ranura,
+                            # que el callback puede reescribir en cuanto vuelve a ``free``.
+                            size = min(len(chunk), len(meter_buf))
+                            meter_buf[:size] = chunk[:size]
+                            meter_len = size
+                            free.append(item)
+                            if len(pending) >= _FLUSH_BYTES:
+                                # ``writeframesraw`` no reescribe la cabecera RIFF en cada lote;
+                                # ``close()`` la corrige una sola vez al cerrar el archivo.
+                                wave_file.writeframesraw(pending)
+                                pending.clear()
+                            frames_written += len(chunk) // bytes_per_frame
+                            if frame_count_target is not None and frames_written >= frame_count_target:
+                                stopped.set()
+                                return
+                        if done:
+                            return
+                except BaseException as error:  # pragma: no cover - ruta excepcional
+                    writer_error = error
+                    stopped.set()
+                finally:
+                    if pending and writer_error is None:
+                        wave_file.writeframesraw(pending)
+                    writer_done.set()
 
             progress = Progress(
                 TextColumn("[bold green]Grabando[/bold green]"),
                 BarColumn(bar_width=None),
-                TextColumn("{task.completed:,} frames"),
+                TextColumn("{task.description}"),
+                TextColumn("{task.fields[nivel]}"),
                 TimeElapsedColumn(),
                 console=self.console,
                 transient=True,
             )
 
-            task_id = progress.add_task("grabacion", total=frame_count_target or 0)
+            task_id = progress.add_task("0 frames", total=frame_count_target or 0, nivel="")
             stack.enter_context(progress)
 
+            writer = threading.Thread(target=_writer, name="grabadora-writer", daemon=True)
+            writer.start()
             try:
-                while True:
-                    try:
-                        chunk = q.get(timeout=0.5)
-                    except queue.Empty:
-                        continue
-
-                    wave_file.writeframes(chunk)
-                    frames_written += len(chunk) // bytes_per_frame
+                # El hilo principal solo refresca la barra; el nivel se calcula sobre el último bloque escrito.
+                # Se espera sobre un evento y no con ``join()``, que no es seguro frente a Ctrl+C.
+                while not writer_done.wait(_PROGRESS_INTERVAL):
+                    completed = frames_written
                     if frame_count_target is not None:
-                        progress.update(task_id, completed=min(frames_written, frame_count_target))
-                        if frames_written >= frame_count_target:
-                            break
-                    else:
-                        progress.update(task_id, completed=frames_written)
+                        completed = min(completed, frame_count_target)
+                    # El texto se formatea una vez por refresco aquí, no en cada repintado de Rich.
+                    progress.update(
+                        task_id,
+                        completed=completed,
+                        description=f"{completed:,} frames",
+                        nivel=_peak_level(memoryview(meter_buf)[:meter_len], self.config.dtype),
+                    )
             except KeyboardInterrupt:  # pragma: no cover - interacción directa
                 self.console.log("[yellow]Grabación interrumpida por el usuario.[/yellow]")
             finally:
-                time.sleep(0.1)  # asegura que el backend vacíe los buffers
+                # ``stop()`` retorna cuando PortAudio ha entregado el último callback; después el
+                # escritor vacía lo que quede en la cola (salvo si ya alcanzó el objetivo) y termina.
+                stream.stop()
+                closing.set()
+                have_data.set()
+                writer_done.wait()
+            if writer_error is not None:
+                raise writer_error
 
         self.console.log(
             f"[bold cyan]Archivo guardado en:[/bold cyan] {output_path} ({frames_written:,} frames)"
@@ -3,19 +3,27 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import functools
 import json
 import os
 import platform
+import shutil
 import sys
 import threading
 import time
+import uuid
 import zipfile
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable
+from typing import Any, AsyncIterator, BinaryIO, Dict, Iterable
 
+import anyio
 from fastapi import (
-    BackgroundTasks,
+    Body,
     FastAPI,
     File,
     Form,
@@ -23,12 +31,17 @@ from fastapi import (
     Request,
     UploadFile,
 )
-from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, ORJSONResponse, Response
 from starlette import status
+from starlette.background import BackgroundTask
 
 from pydub.exceptions import CouldntDecodeError
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
 from .. import __version__
 from ..config import ConfigManager, PATHS
 from ..constants import UI_DIST_PATH
@@ -41,18 +54,20 @@ from ..transcription import (
     Segment,
     Transcriber,
 )
-from ..summarizer import ActionItem, SummaryDocument, SummaryOrchestrator, export_document, get_template
+from ..summarizer import ActionItem, SummaryDocument, SummaryOrchestrator, export_document_to, get_template
 from ._selftest_audio import SELFTEST_WAV_BASE64
-from .jobs import JobArtifact, JobStatus, JobStore
+from .jobs import CANCELLED_MESSAGE, JobArtifact, JobStatus, JobStore, encode_json
 from .models import (
     ExportRequest,
     HealthResponse,
     JobsEnvelope,
     LicenseStatusPayload,
+    SelfTestRequest,
     SummarizeRequest,
     SummaryResponse,
     TranscriptionJobResponse,
 )
+from .static_files import CachedStaticFiles
 
 
 logger = configure_logging()
@@ -74,6 +89,20 @@ ALLOWED_UPLOAD_SUFFIXES = {
     ".webm",
     ".wma",
 }
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+UPLOAD_SNIFF_BYTES = 512
+# ``sendfile`` between two regular files is only supported by Linux.
+_SENDFILE_SUPPORTED = sys.platform.startswith("linux") and hasattr(os, "sendfile")
+DIAG_CACHE_TTL_SECONDS = 2.0
+PRUNE_INTERVAL_SECONDS = 300
+THREADPOOL_TOKENS = 128
+ARTIFACT_CHUNK_SIZE = 1024 * 1024
+SUMMARY_DOCUMENT_CACHE_SIZE = 64
+TRANSCRIPT_CACHE_SIZE = 8
+TRANSCRIPTION_BATCH_SIZE = 8
+TRANSCRIPTION_BATCH_WAIT_SECONDS = 0.05
+PROGRESS_MIN_INTERVAL_SECONDS = 0.5
+PROGRESS_MIN_STEP_PERCENT = 0.1
 
 
 class BackendContext:
@@ -101,6 +130,22 @@ class BackendContext:
 
 CONTEXT = BackendContext()
 
+# Whisper inference gets its own worker so it never occupies the threadpool that serves the
+# blocking parts of the other endpoints (uploads, exports, diagnostics).
+_TRANSCRIBE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transcriptor-whisper")
+
+_SELFTEST_WAV_BYTES = base64.b64decode(SELFTEST_WAV_BASE64)
+
+# Rebuilt ``SummaryDocument`` objects keyed by (job id, summary cache key), so exporting the same
+# summary in several formats does not reconstruct it each time. Only touched from the event loop.
+_SUMMARY_DOCUMENTS: "OrderedDict[tuple[str, str], SummaryDocument]" = OrderedDict()
+# Decoded transcripts of the most recently summarised jobs: trying several templates or modes on
+# the same meeting reads the file once.
+_TRANSCRIPTS: "OrderedDict[str, str]" = OrderedDict()
+
+_DIAG_CACHE: tuple[float, int, Dict[str, Any]] | None = None
+_DIAG_LOCK = threading.Lock()
+
 
 def _require_diag_token(request: Request) -> None:
     if not DIAG_TOKEN:
@@ -114,15 +159,35 @@ def _require_diag_token(request: Request) -> None:
 
 
 def _diagnostic_snapshot() -> Dict[str, Any]:
+    """Return the diagnostic snapshot, reusing a recent one while no job changed status."""
+    global _DIAG_CACHE
+    now = time.monotonic()
+    # The snapshot only counts jobs by status, so progress ticks of a running job must not expire it.
+    revision = CONTEXT.jobs.status_revision
+    with _DIAG_LOCK:
+        cached = _DIAG_CACHE
+        if cached and now - cached[0] < DIAG_CACHE_TTL_SECONDS and cached[1] == revision:
+            return cached[2]
+        snapshot = _build_diagnostic_snapshot()
+        _DIAG_CACHE = (now, revision, snapshot)
+        return snapshot
+
+
+def _build_diagnostic_snapshot() -> Dict[str, Any]:
     license_status = CONTEXT.license.status().as_dict()
     models_dir = CONTEXT.model_provider.models_dir
     available_models: Iterable[str] = []
     if models_dir.is_dir():
         available_models = sorted({candidate.parent.name for candidate in models_dir.glob("*/model.bin")})
-    jobs_snapshot = CONTEXT.jobs.list()
+    total_jobs = 0
+    failed_jobs = 0
+    for job in CONTEXT.jobs.list():
+        total_jobs += 1
+        if job.status == JobStatus.FAILED:
+            failed_jobs += 1
 
     return {
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
         "version": __version__,
         "python": sys.version,
         "platform": {
@@ -144,19 +209,148 @@ def _diagnostic_snapshot() -> Dict[str, Any]:
             "ffmpeg": str(PATHS.ffmpeg_executable) if PATHS.ffmpeg_executable else None,
         },
         "jobs": {
-            "total": len(jobs_snapshot),
-            "failed": sum(1 for job in jobs_snapshot if job.status == JobStatus.FAILED),
+            "total": total_jobs,
+            "failed": failed_jobs,
         },
         "solo_local": True,
         "models_present": list(available_models),
     }
 
 
+def _is_not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """Evaluate the conditional GET headers; ``If-None-Match`` takes precedence as per RFC 9110."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        return etag in {tag.strip() for tag in if_none_match.split(",")}
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            # ``-0000`` and other zone-less dates parse as naive; HTTP dates are always UTC.
+            since = since.replace(tzinfo=timezone.utc)
+        return int(mtime) <= since.timestamp()
+    return False
+
+
+async def _prune_loop() -> None:
+    """Periodically drop expired jobs so request handlers never pay for the rmtree work."""
+    while True:
+        try:
+            await asyncio.to_thread(CONTEXT.jobs.prune, retention_days=CONTEXT.config.retention_days())
+        except Exception:  # pragma: no cover - runtime safeguard
+            logger.exception("Error purgando trabajos antiguos")
+        await asyncio.sleep(PRUNE_INTERVAL_SECONDS)
+
+
+def _sendfile_upload(source: BinaryIO, target_fd: int, sniff_bytes: int) -> tuple[int, bytes] | None:
+    """Copy a disk-backed upload with ``os.sendfile``; returns ``None`` when that is not possible."""
+    # Starlette spools small uploads in memory; asking for their fileno would force a rollover.
+    if not _SENDFILE_SUPPORTED or not getattr(source, "_rolled", True):
+        return None
+    try:
+        source_fd = source.fileno()
+        start = source.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+    offset = start
+    try:
+        while True:
+            sent = os.sendfile(target_fd, source_fd, offset, UPLOAD_CHUNK_SIZE)
+            if sent == 0:
+                break
+            offset += sent
+    except OSError:
+        if offset != start:
+            raise
+        return None
+    head = os.pread(source_fd, sniff_bytes, start) if sniff_bytes else b""
+    return offset - start, head
+
+
+def _copy_upload(source: BinaryIO, path: Path, sniff_bytes: int = UPLOAD_SNIFF_BYTES) -> tuple[int, bytes]:
+    """Copy the spooled upload to ``path``; runs in a worker thread to keep the event loop free.
+
+    Returns the number of bytes written and the leading bytes used for content sniffing, so the
+    caller does not need to stat or reopen the file. On Linux the copy stays in the kernel.
+    """
+    with path.open("wb") as target:
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(target.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        copied = _sendfile_upload(source, target.fileno(), sniff_bytes)
+        if copied is not None:
+            return copied
+        size = 0
+        head = b""
+        while True:
+            chunk = source.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            if len(head) < sniff_bytes:
+                head += chunk[: sniff_bytes - len(head)]
+            size += len(chunk)
+            target.write(chunk)
+    return size, head
+
+
+def _write_segments_json(segments_path: Path, segments: list[Segment]) -> None:
+    # Both encoders take the ``Segment`` dataclasses directly and emit {start, end, text} objects,
+    # so no intermediate list of dicts is built.
+    if orjson is not None:
+        CONTEXT.writer.write_bytes(segments_path, orjson.dumps(segments, option=orjson.OPT_INDENT_2))
+    else:
+        CONTEXT.writer.write_bytes(
+            segments_path, json.dumps(segments, ensure_ascii=False, indent=2, default=vars).encode("utf-8")
+        )
+
+
+async def _write_transcript_artifacts(
+    transcript_path: Path,
+    captions_path: Path,
+    segments_path: Path,
+    text: str,
+    segments: list[Segment],
+) -> None:
+    """Write the TXT, SRT and JSON artifacts concurrently in worker threads; long meetings produce megabytes."""
+    await asyncio.gather(
+        asyncio.to_thread(CONTEXT.writer.write_txt, transcript_path, text),
+        asyncio.to_thread(CONTEXT.writer.write_srt, captions_path, segments),
+        asyncio.to_thread(_write_segments_json, segments_path, segments),
+    )
+
+
+def _build_doctor_bundle(bundle_path: Path, snapshot: Dict[str, Any]) -> None:
+    """Write the ``/__doctor`` ZIP; runs in a worker thread because compressing logs can take seconds."""
+    with zipfile.ZipFile(bundle_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("system.json", json.dumps(snapshot, ensure_ascii=False, indent=2))
+        if PATHS.config_file.exists():
+            archive.write(PATHS.config_file, arcname="config.json")
+        if PATHS.log_file.exists():
+            # The log can grow large: copy it in 1 MiB chunks instead of the default 8 KiB.
+            with PATHS.log_file.open("rb") as source, archive.open("logs/app.log", "w", force_zip64=True) as target:
+                shutil.copyfileobj(source, target, length=1024 * 1024)
+        models_manifest = {
+            "models": [folder.name for folder in CONTEXT.model_provider.models_dir.iterdir() if folder.is_dir()],
+        }
+        archive.writestr("models_manifest.json", json.dumps(models_manifest, ensure_ascii=False, indent=2))
+        failed_jobs = [job for job in CONTEXT.jobs.list() if job.status == JobStatus.FAILED]
+        if failed_jobs:
+            latest = failed_jobs[0]
+            archive.writestr(
+                "last_failed_job.json",
+                json.dumps(latest.as_dict(), ensure_ascii=False, default=str, indent=2),
+            )
+
+
 def _decode_selftest_audio() -> Path:
     target = PATHS.diagnostics_dir / "selftest.wav"
     if not target.exists():
-        data = base64.b64decode(SELFTEST_WAV_BASE64)
-        target.write_bytes(data)
+        target.write_bytes(_SELFTEST_WAV_BYTES)
     return target
 
 
@@ -196,24 +390,55 @@ def _run_selftest(model_name: str | None = None) -> Dict[str, Any]:
 def create_app() -> FastAPI:
     openapi_url = "/openapi.json" if DOCS_ENABLED else None
     docs_url = "/docs" if DOCS_ENABLED else None
-    app = FastAPI(title="Transcriptor de FERIA", version=__version__, openapi_url=openapi_url, docs_url=docs_url, redoc_url=None)
+    # The UI polls /jobs constantly; render JSON with orjson when it is installed.
+    default_response_class = ORJSONResponse if orjson is not None else JSONResponse
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        # Starlette runs file responses and upload spooling on anyio's pool (40 threads by default);
+        # a few slow downloads must not stall /jobs and /health polling.
+        anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_TOKENS
+        _transcription_queue()
+        app.state.prune_task = asyncio.create_task(_prune_loop())
+        # ``has_cuda`` memoises its answer, but the first probe imports torch; do it off the event
+        # loop at startup so ``/health`` and the diagnostics never pay for it inside a request.
+        app.state.cuda_probe = asyncio.create_task(asyncio.to_thread(CONTEXT.model_provider.has_cuda))
+        try:
+            yield
+        finally:
+            app.state.prune_task.cancel()
+            worker = getattr(app.state, "transcription_worker", None)
+            if worker is not None:
+                worker.cancel()
+
+    app = FastAPI(
+        title="Transcriptor de FERIA",
+        version=__version__,
+        openapi_url=openapi_url,
+        docs_url=docs_url,
+        redoc_url=None,
+        default_response_class=default_response_class,
+        lifespan=lifespan,
+    )
 
     @app.get("/health", response_model=HealthResponse)
-    async def health() -> HealthResponse:
+    async def health() -> Response:
         status_payload = CONTEXT.license.status().as_dict()
         cuda_available = CONTEXT.model_provider.has_cuda()
         vad_available = CONTEXT.transcriber.vad_available
         degraded = (not cuda_available) or (not vad_available)
-        return HealthResponse(
-            status="degraded" if degraded else "ok",
-            time=datetime.utcnow(),
-            version=__version__,
-            license=status_payload,
-            cuda_available=cuda_available,
-            vad_available=vad_available,
-            missing_vad_assets=list(CONTEXT.transcriber.missing_vad_assets),
-            ffmpeg_path=str(PATHS.ffmpeg_executable) if PATHS.ffmpeg_executable else None,
-        )
+        # Polled constantly and shaped here; ``HealthResponse`` documents it without re-validating.
+        payload = {
+            "status": "degraded" if degraded else "ok",
+            "time": datetime.now(timezone.utc),
+            "version": __version__,
+            "license": status_payload,
+            "cuda_available": cuda_available,
+            "vad_available": vad_available,
+            "missing_vad_assets": list(CONTEXT.transcriber.missing_vad_assets),
+            "ffmpeg_path": str(PATHS.ffmpeg_executable) if PATHS.ffmpeg_executable else None,
+        }
+        return Response(content=encode_json(payload), media_type="application/json")
 
     # ------------------------------------------------------------------
     def _normalise_suffix(filename: str | None) -> str:
@@ -238,22 +463,19 @@ def create_app() -> FastAPI:
                 detail=f"Tipo no soportado: {upload.content_type}",
             )
 
+        # Browsers only label real media as audio/* or video/*; the HTML/JSON sniff is kept for
+        # untyped and octet-stream uploads.
+        trusted = content_type.startswith(("audio/", "video/"))
         suffix = _normalise_suffix(upload.filename)
         path = job_dir / f"entrada{suffix}"
-        with path.open("wb") as target:
-            while True:
-                chunk = await upload.read(1024 * 1024)
-                if not chunk:
-                    break
-                target.write(chunk)
+        size, sample = await asyncio.to_thread(
+            _copy_upload, upload.file, path, 0 if trusted else UPLOAD_SNIFF_BYTES
+        )
         await upload.close()
-        size = path.stat().st_size
         if size == 0:
             path.unlink(missing_ok=True)
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="El archivo subido está vacío")
-        with path.open("rb") as source:
-            sample = source.read(512)
-        if size < 128 or sample.lstrip().startswith((b"<!", b"<html", b"{", b"[")):
+        if size < 128 or (not trusted and sample.lstrip().startswith((b"<!", b"<html", b"{", b"["))):
             path.unlink(missing_ok=True)
             snippet = sample[:64]
             raise HTTPException(
@@ -263,14 +485,31 @@ def create_app() -> FastAPI:
         return path
 
     async def _run_transcription(job_id: str, audio_path: Path, options: Dict[str, Any]) -> None:
-        CONTEXT.jobs.set_status(job_id, JobStatus.PROCESSING, message="Procesando")
+        if not CONTEXT.jobs.start(job_id):
+            # Cancelled while it was still waiting in the queue; ``cancel`` already failed it.
+            audio_path.unlink(missing_ok=True)
+            return
+        cancel_event = CONTEXT.jobs.cancel_event(job_id)
         start = time.monotonic()
-        cancel_event = threading.Event()
+        last_push = 0.0
+        last_percent = -1.0
 
         def _on_progress(percent: float | None, segment: Segment) -> None:
-            if percent is None:
+            nonlocal last_push, last_percent
+            if percent is None or cancel_event.is_set():
+                return
+            # Word-level callbacks arrive far faster than the percentage visibly moves; drop those
+            # before even reading the clock.
+            if percent - last_percent < PROGRESS_MIN_STEP_PERCENT and percent < 100:
                 return
-            elapsed = max(0.1, time.monotonic() - start)
+            now = time.monotonic()
+            # The UI polls at 1 Hz, so 2 Hz is plenty; each update still bumps the store revision and
+            # invalidates the cached /jobs encoding.
+            if now - last_push < PROGRESS_MIN_INTERVAL_SECONDS and percent < 100:
+                return
+            last_push = now
+            last_percent = percent
+            elapsed = max(0.1, now - start)
             eta = None
             if percent > 0:
                 total_estimate = elapsed / (percent / 100.0)
@@ -278,18 +517,26 @@ def create_app() -> FastAPI:
             CONTEXT.jobs.set_progress(job_id, percent, eta_seconds=eta)
 
         try:
-            result = await asyncio.to_thread(
-                CONTEXT.transcriber.transcribe,
-                audio_path,
-                model_name=options["model"],
-                device=options["device"],
-                language=options.get("language"),
-                vad_filter=options.get("vad", True),
-                beam_size=options.get("beam_size", 5),
-                cancel_event=cancel_event,
-                on_progress=_on_progress,
+            result = await asyncio.get_running_loop().run_in_executor(
+                _TRANSCRIBE_EXECUTOR,
+                functools.partial(
+                    CONTEXT.transcriber.transcribe,
+                    audio_path,
+                    model_name=options["model"],
+                    device=options["device"],
+                    language=options.get("language"),
+                    vad_filter=options.get("vad", True),
+                    beam_size=options.get("beam_size", 5),
+                    cancel_event=cancel_event,
+                    on_progress=_on_progress,
+                ),
             )
 
+            if cancel_event.is_set():
+                CONTEXT.jobs.add_metadata(job_id, cancelled=True)
+                CONTEXT.jobs.set_status(job_id, JobStatus.FAILED, message=CANCELLED_MESSAGE)
+                return
+
             text = result.text
             segments = result.segments
             elapsed = result.elapsed
@@ -312,31 +559,21 @@ def create_app() -> FastAPI:
             captions_path = job_dir / "subtitulos.srt"
             segments_path = job_dir / "segmentos.json"
 
-            CONTEXT.writer.write_txt(transcript_path, text)
-            CONTEXT.writer.write_srt(captions_path, segments)
-            segments_payload = [
-                {"start": segment.start, "end": segment.end, "text": segment.text}
-                for segment in segments
-            ]
-            segments_path.write_text(json.dumps(segments_payload, ensure_ascii=False, indent=2), encoding="utf-8")
-
-            CONTEXT.jobs.attach_artifact(
-                job_id,
-                "transcript",
-                JobArtifact(name="Transcripción", path=transcript_path, content_type="text/plain"),
-            )
-            CONTEXT.jobs.attach_artifact(
-                job_id,
-                "captions",
-                JobArtifact(name="Subtítulos", path=captions_path, content_type="application/x-subrip"),
-            )
-            CONTEXT.jobs.attach_artifact(
-                job_id,
-                "segments",
-                JobArtifact(name="Segmentos", path=segments_path, content_type="application/json"),
-            )
+            await _write_transcript_artifacts(transcript_path, captions_path, segments_path, text, segments)
 
-            CONTEXT.jobs.set_status(job_id, JobStatus.COMPLETED, message="Transcripción lista")
+            artifacts = {
+                "transcript": JobArtifact(name="Transcripción", path=transcript_path, content_type="text/plain"),
+                "captions": JobArtifact(
+                    name="Subtítulos", path=captions_path, content_type="application/x-subrip"
+                ),
+                "segments": JobArtifact(name="Segmentos", path=segments_path, content_type="application/json"),
+            }
+            if not CONTEXT.jobs.complete(job_id, artifacts, message="Transcripción lista"):
+                # Cancelled while the artifacts were being written: drop them and honour the cancel.
+                for artifact in artifacts.values():
+                    artifact.path.unlink(missing_ok=True)
+                CONTEXT.jobs.add_metadata(job_id, cancelled=True)
+                CONTEXT.jobs.set_status(job_id, JobStatus.FAILED, message=CANCELLED_MESSAGE)
         except CouldntDecodeError as exc:  # pragma: no cover - runtime safeguard
             logger.warning("No se pudo decodificar el audio %s: %s", audio_path, exc)
             CONTEXT.jobs.set_status(
@@ -348,21 +585,62 @@ def create_app() -> FastAPI:
             logger.exception("Error transcribiendo %s", audio_path)
             CONTEXT.jobs.set_status(job_id, JobStatus.FAILED, message=str(exc))
         finally:
+            CONTEXT.jobs.release_cancel_event(job_id)
             try:
                 audio_path.unlink()
             except OSError:
                 pass
 
+    async def _transcription_worker(queue: asyncio.Queue) -> None:
+        # faster-whisper cannot decode several files in one forward pass, so the batching happens at
+        # the model level: jobs arriving within a short window are grouped by (model, device) and
+        # run back to back, loading each model once instead of thrashing the shared ModelProvider.
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + TRANSCRIPTION_BATCH_WAIT_SECONDS
+            while len(batch) < TRANSCRIPTION_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            groups: Dict[tuple[str, str], int] = {}
+            for _, _, options in batch:
+                groups.setdefault((options["model"], options["device"]), len(groups))
+            batch.sort(key=lambda item: groups[(item[2]["model"], item[2]["device"])])
+            for job_id, audio_path, options in batch:
+                try:
+                    await _run_transcription(job_id, audio_path, options)
+                finally:
+                    queue.task_done()
+
+    def _transcription_queue() -> asyncio.Queue:
+        """Return the job queue, (re)starting its consumer if it is not running."""
+        queue = getattr(app.state, "transcription_queue", None)
+        if queue is None:
+            queue = app.state.transcription_queue = asyncio.Queue()
+        worker = getattr(app.state, "transcription_worker", None)
+        if worker is None or worker.done():
+            if worker is not None and not worker.cancelled() and worker.exception() is not None:
+                logger.error("El worker de transcripción terminó inesperadamente: %s", worker.exception())
+            app.state.transcription_worker = asyncio.create_task(_transcription_worker(queue))
+        return queue
+
+    def _enqueue_transcription(job_id: str, audio_path: Path, options: Dict[str, Any]) -> None:
+        _transcription_queue().put_nowait((job_id, audio_path, options))
+
     @app.post("/transcribe", response_model=TranscriptionJobResponse, status_code=status.HTTP_201_CREATED)
     async def transcribe(
-        background: BackgroundTasks,
         file: UploadFile = File(...),
         model: str = Form("medium"),
         device: str = Form("auto"),
         vad: bool = Form(True),
         beam_size: int = Form(5),
         language: str | None = Form(None),
-    ) -> TranscriptionJobResponse:
+    ) -> Response:
         requested_device = device
         resolved_device = CONTEXT.device_for(device)
         requested_vad = vad
@@ -375,7 +653,6 @@ def create_app() -> FastAPI:
             beam_size=beam_size,
             language=language,
         )
-        CONTEXT.jobs.prune(retention_days=CONTEXT.config.retention_days())
         audio_path = await _persist_upload(job.id, file)
         metadata: Dict[str, Any] = {
             "requested_device": requested_device,
@@ -390,8 +667,7 @@ def create_app() -> FastAPI:
         if metadata:
             CONTEXT.jobs.add_metadata(job.id, **metadata)
 
-        background.add_task(
-            _run_transcription,
+        _enqueue_transcription(
             job.id,
             audio_path,
             {
@@ -402,30 +678,48 @@ def create_app() -> FastAPI:
                 "language": language,
             },
         )
-        return TranscriptionJobResponse(**job.as_dict())
+        return Response(content=job.as_json(), status_code=status.HTTP_201_CREATED, media_type="application/json")
 
     @app.get("/jobs", response_model=JobsEnvelope)
-    async def list_jobs() -> JobsEnvelope:
-        CONTEXT.jobs.prune(retention_days=CONTEXT.config.retention_days())
-        records = [TranscriptionJobResponse(**job.as_dict()) for job in CONTEXT.jobs.list()]
-        return JobsEnvelope(jobs=records)
+    async def list_jobs() -> Response:
+        # The UI polls this endpoint; serve the cached encoding instead of re-validating every job.
+        return Response(content=CONTEXT.jobs.snapshot_json(), media_type="application/json")
 
     @app.get("/jobs/{job_id}", response_model=TranscriptionJobResponse)
-    async def job_detail(job_id: str) -> TranscriptionJobResponse:
+    async def job_detail(job_id: str) -> Response:
         job = CONTEXT.jobs.get(job_id)
         if not job:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trabajo no encontrado")
-        return TranscriptionJobResponse(**job.as_dict())
+        return Response(content=job.as_json(), media_type="application/json")
+
+    @app.post("/jobs/{job_id}/cancel", response_model=TranscriptionJobResponse)
+    async def cancel_job(job_id: str) -> Response:
+        job = CONTEXT.jobs.get(job_id)
+        if not job:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trabajo no encontrado")
+        if not CONTEXT.jobs.cancel(job_id):
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="El trabajo ya ha finalizado")
+        return Response(content=job.as_json(), media_type="application/json")
 
     @app.get("/files/{job_id}/{artifact}")
-    async def download(job_id: str, artifact: str) -> FileResponse:
+    async def download(job_id: str, artifact: str, request: Request) -> Response:
         job = CONTEXT.jobs.get(job_id)
         if not job:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trabajo no encontrado")
         if artifact not in job.artifacts:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Archivo no disponible")
         item = job.artifacts[artifact]
-        return FileResponse(item.path, media_type=item.content_type, filename=item.path.name)
+        # With the cached stat the response skips its own stat() and already carries ETag/Last-Modified.
+        response = FileResponse(item.path, media_type=item.content_type, filename=item.path.name, stat_result=item.stat)
+        # Each chunk is a threadpool round-trip; 1 MiB instead of Starlette's 64 KiB keeps large
+        # transcripts from holding pool tokens for hundreds of hops.
+        response.chunk_size = ARTIFACT_CHUNK_SIZE
+        if item.stat is not None and _is_not_modified(request, response.headers["etag"], item.stat.st_mtime):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"etag": response.headers["etag"], "last-modified": response.headers["last-modified"]},
+            )
+        return response
 
     @app.post("/summarize", response_model=SummaryResponse)
     async def summarize(request: SummarizeRequest) -> SummaryResponse:
@@ -445,10 +739,24 @@ def create_app() -> FastAPI:
             response_payload = {k: v for k, v in cached.items() if k != "language"}
             return SummaryResponse(**response_payload)
 
-        text = transcript_artifact.path.read_text(encoding="utf-8")
-        license_status = CONTEXT.license.status()
-        allow_redactado = license_status.allows("summary:redactado")
-        document = CONTEXT.orchestrator.generate(
+        _, response_payload = await _generate_summary(job.id, transcript_artifact.path, request, cache_key)
+        return SummaryResponse(**response_payload)
+
+    async def _generate_summary(
+        job_id: str,
+        transcript_path: Path,
+        request: SummarizeRequest | ExportRequest,
+        cache_key: str,
+    ) -> tuple[SummaryDocument, Dict[str, Any]]:
+        # Only reached on a summary cache miss, so the license is consulted once per new summary.
+        # Long meetings produce multi-megabyte transcripts: read and decode them off the event loop,
+        # overlapping the read with the license lookup.
+        text, allow_redactado = await asyncio.gather(
+            _read_transcript(job_id, transcript_path),
+            asyncio.to_thread(CONTEXT.license.allows, "summary:redactado"),
+        )
+        document = await asyncio.to_thread(
+            CONTEXT.orchestrator.generate,
             text=text,
             template_slug=request.template,
             mode=request.mode,
@@ -457,11 +765,29 @@ def create_app() -> FastAPI:
             meeting_date=request.meeting_date,
             redactado_enabled=allow_redactado,
         )
-        response_payload = _summary_to_response(job.id, document)
+        response_payload = _summary_to_response(job_id, document)
         cache_payload = dict(response_payload)
         cache_payload["language"] = document.language
-        CONTEXT.jobs.store_summary(job.id, cache_key, cache_payload)
-        return SummaryResponse(**response_payload)
+        CONTEXT.jobs.store_summary(job_id, cache_key, cache_payload)
+        _remember_document(job_id, cache_key, document)
+        return document, response_payload
+
+    async def _read_transcript(job_id: str, transcript_path: Path) -> str:
+        text = _TRANSCRIPTS.get(job_id)
+        if text is not None:
+            _TRANSCRIPTS.move_to_end(job_id)
+            return text
+        text = await asyncio.to_thread(transcript_path.read_text, encoding="utf-8")
+        _TRANSCRIPTS[job_id] = text
+        while len(_TRANSCRIPTS) > TRANSCRIPT_CACHE_SIZE:
+            _TRANSCRIPTS.popitem(last=False)
+        return text
+
+    def _remember_document(job_id: str, cache_key: str, document: SummaryDocument) -> None:
+        _SUMMARY_DOCUMENTS[(job_id, cache_key)] = document
+        _SUMMARY_DOCUMENTS.move_to_end((job_id, cache_key))
+        while len(_SUMMARY_DOCUMENTS) > SUMMARY_DOCUMENT_CACHE_SIZE:
+            _SUMMARY_DOCUMENTS.popitem(last=False)
 
     def _summary_to_response(job_id: str, document: SummaryDocument) -> Dict[str, Any]:
         return {
@@ -486,7 +812,7 @@ def create_app() -> FastAPI:
         }
 
     @app.post("/export")
-    async def export_summary(request: ExportRequest) -> StreamingResponse:
+    async def export_summary(request: ExportRequest) -> FileResponse:
         job = CONTEXT.jobs.get(request.job_id)
         if not job:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trabajo no encontrado")
@@ -498,28 +824,30 @@ def create_app() -> FastAPI:
         cache_key = f"{request.mode}:{request.template}:{request.language}:{request.client_name}:{request.meeting_date}"
         cached = CONTEXT.jobs.summary(job.id, cache_key)
         if cached:
-            document = _payload_to_document(cached)
+            document = _SUMMARY_DOCUMENTS.get((job.id, cache_key))
+            if document is None:
+                document = _payload_to_document(cached)
+                _remember_document(job.id, cache_key, document)
+            else:
+                _SUMMARY_DOCUMENTS.move_to_end((job.id, cache_key))
         else:
-            text = transcript_artifact.path.read_text(encoding="utf-8")
-            license_status = CONTEXT.license.status()
-            allow_redactado = license_status.allows("summary:redactado")
-            document = CONTEXT.orchestrator.generate(
-                text=text,
-                template_slug=request.template,
-                mode=request.mode,
-                language=request.language,
-                client=request.client_name,
-                meeting_date=request.meeting_date,
-                redactado_enabled=allow_redactado,
-            )
-            cache_payload = _summary_to_response(job.id, document)
-            cache_payload["language"] = document.language
-            CONTEXT.jobs.store_summary(job.id, cache_key, cache_payload)
+            document, _ = await _generate_summary(job.id, transcript_artifact.path, request, cache_key)
 
-        content, content_type = export_document(document, request.format)
-        filename = f"{request.template}-{request.mode}.{_extension_for(request.format)}"
-        headers = {"Content-Disposition": f"attachment; filename={filename}"}
-        return StreamingResponse(iter([content]), media_type=content_type, headers=headers)
+        extension = _extension_for(request.format)
+        filename = f"{request.template}-{request.mode}.{extension}"
+        # The export is written to a scratch file and streamed from disk, then removed once sent.
+        export_path = PATHS.jobs_dir / job.id / f"export-{uuid.uuid4().hex}.{extension}"
+        try:
+            content_type = await asyncio.to_thread(export_document_to, document, request.format, export_path)
+        except Exception:
+            export_path.unlink(missing_ok=True)
+            raise
+        return FileResponse(
+            export_path,
+            media_type=content_type,
+            filename=filename,
+            background=BackgroundTask(export_path.unlink, missing_ok=True),
+        )
 
     def _extension_for(fmt: str) -> str:
         return {
@@ -570,44 +898,26 @@ def create_app() -> FastAPI:
         return _diagnostic_snapshot()
 
     @app.post("/__selftest")
-    async def selftest(request: Request) -> Dict[str, Any]:
+    async def selftest(request: Request, body: SelfTestRequest | None = Body(None)) -> Dict[str, Any]:
         _require_diag_token(request)
-        content_type = request.headers.get("content-type", "").lower()
-        body = await request.json() if content_type.startswith("application/json") else {}
-        model_name = body.get("model") if isinstance(body, dict) else None
-        result = await asyncio.to_thread(_run_selftest, model_name)
+        model_name = body.model if body is not None else None
+        result = await asyncio.get_running_loop().run_in_executor(_TRANSCRIBE_EXECUTOR, _run_selftest, model_name)
         return {"status": "ok", "result": result}
 
     @app.post("/__doctor")
     async def doctor(request: Request) -> Dict[str, Any]:
         _require_diag_token(request)
         snapshot = _diagnostic_snapshot()
-        timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
         PATHS.diagnostics_dir.mkdir(parents=True, exist_ok=True)
         bundle_path = PATHS.diagnostics_dir / f"doctor-{timestamp}.zip"
-        with zipfile.ZipFile(bundle_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-            archive.writestr("system.json", json.dumps(snapshot, ensure_ascii=False, indent=2))
-            if PATHS.config_file.exists():
-                archive.write(PATHS.config_file, arcname="config.json")
-            if PATHS.log_file.exists():
-                archive.write(PATHS.log_file, arcname="logs/app.log")
-            models_manifest = {
-                "models": [folder.name for folder in CONTEXT.model_provider.models_dir.iterdir() if folder.is_dir()],
-            }
-            archive.writestr("models_manifest.json", json.dumps(models_manifest, ensure_ascii=False, indent=2))
-            failed_jobs = [job for job in CONTEXT.jobs.list() if job.status == JobStatus.FAILED]
-            if failed_jobs:
-                latest = failed_jobs[0]
-                archive.writestr(
-                    "last_failed_job.json",
-                    json.dumps(latest.as_dict(), ensure_ascii=False, default=str, indent=2),
-                )
+        await asyncio.to_thread(_build_doctor_bundle, bundle_path, snapshot)
         return {"status": "ok", "bundle": str(bundle_path)}
 
     if UI_DIST_PATH.is_dir() and any(UI_DIST_PATH.iterdir()):
         app.mount(
             "/",
-            StaticFiles(directory=str(UI_DIST_PATH), html=True),
+            CachedStaticFiles(directory=str(UI_DIST_PATH), html=True),
             name="frontend",
         )
     else:
@@ -1,18 +1,28 @@
 """Persistent job registry used by the local FastAPI backend."""
 from __future__ import annotations
 
+import atexit
+import itertools
 import json
+import operator
+import os
+import queue
 import shutil
 import threading
 import time
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ..config import PATHS
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
 
 class JobStatus:
     QUEUED = "queued"
@@ -21,19 +31,45 @@ class JobStatus:
     FAILED = "failed"
 
 
-@dataclass
+CANCELLED_MESSAGE = "Transcripción cancelada"
+
+
+@dataclass(slots=True)
 class JobArtifact:
     name: str
     path: Path
     content_type: str
+    # Captured when the artifact is attached; artifacts are never rewritten afterwards.
+    stat: Optional[os.stat_result] = field(default=None, compare=False, repr=False)
+
+
+_PUBLIC_FIELDS = (
+    "id",
+    "filename",
+    "status",
+    "message",
+    "progress",
+    "eta_seconds",
+    "created_at",
+    "updated_at",
+    "duration_seconds",
+    "language",
+    "device",
+    "model",
+    "vad",
+    "beam_size",
+)
+_public_values = operator.attrgetter(*_PUBLIC_FIELDS)
+_created_at = operator.attrgetter("created_at")
 
 
-@dataclass
+@dataclass(slots=True)
 class JobRecord:
     id: str
     filename: str
-    created_at: datetime
-    updated_at: datetime
+    # Epoch seconds; converted to datetimes only when the public view or the manifest is built.
+    created_at: float
+    updated_at: float
     status: str = JobStatus.QUEUED
     message: Optional[str] = None
     progress: float = 0.0
@@ -47,27 +83,82 @@ class JobRecord:
     artifacts: Dict[str, JobArtifact] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
     summaries: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Bumped by ``JobStore`` after every mutation; ``as_dict`` reuses its last result while it holds.
+    version: int = field(default=0, init=False, repr=False, compare=False)
+    _dict_cache: Optional[Tuple[int, Dict[str, Any]]] = field(default=None, init=False, repr=False, compare=False)
+    _json_cache: Optional[Tuple[int, bytes]] = field(default=None, init=False, repr=False, compare=False)
 
     def as_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "filename": self.filename,
-            "status": self.status,
-            "message": self.message,
-            "progress": round(self.progress, 2),
-            "eta_seconds": self.eta_seconds,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "duration_seconds": self.duration_seconds,
-            "language": self.language,
-            "device": self.device,
-            "model": self.model,
-            "vad": self.vad,
-            "beam_size": self.beam_size,
-            "artifacts": {key: {"name": art.name, "content_type": art.content_type} for key, art in self.artifacts.items()},
-            "metadata": self.metadata,
-            "summary_modes": list(self.summaries.keys()),
+        """Return the public view of the job; the result is shared and must not be mutated."""
+        # Read the version before the fields so a concurrent mutation can never leave a stale entry.
+        version = self.version
+        cached = self._dict_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        payload = dict(zip(_PUBLIC_FIELDS, _public_values(self)))
+        payload["progress"] = round(self.progress, 2)
+        payload["created_at"] = _utc_datetime(self.created_at)
+        payload["updated_at"] = _utc_datetime(self.updated_at)
+        payload["artifacts"] = {
+            key: {"name": art.name, "content_type": art.content_type} for key, art in self.artifacts.items()
         }
+        payload["metadata"] = self.metadata
+        payload["summary_modes"] = list(self.summaries)
+        self._dict_cache = (version, payload)
+        return payload
+
+    def as_json(self) -> bytes:
+        """Return ``as_dict`` encoded as JSON, re-encoded only after the job changes."""
+        version = self.version
+        cached = self._json_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        body = encode_json(self.as_dict())
+        self._json_cache = (version, body)
+        return body
+
+
+def _utc_datetime(timestamp: float) -> datetime:
+    # The API has always exposed naive UTC datetimes; keep that shape.
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+def _isoformat(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_json(payload: Any) -> bytes:
+    """Encode an already-shaped API payload, bypassing response-model validation."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, default=_isoformat).encode("utf-8")
+
+
+MANIFEST_FLUSH_INTERVAL = 0.25
+LOCK_SHARDS = 16
+DELETING_SUFFIX = ".deleting"
+# Left out of ``index.json``: the ISO strings duplicate the epoch fields and summary bodies are large,
+# so the index only lists the summary modes and the bodies are read from the manifest when needed.
+_INDEX_OMITTED = frozenset({"created_at", "updated_at", "summaries"})
+
+
+def _write_json(path: Path, payload: Dict[str, Any], *, indent: bool) -> None:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        data = orjson.dumps(payload, option=option)
+    else:
+        data = json.dumps(payload, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+    # Write beside the target and swap it in, so a crash never leaves a truncated JSON behind.
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: Path) -> Any:
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 class JobStore:
@@ -76,26 +167,71 @@ class JobStore:
     def __init__(self, storage_dir: Path | None = None) -> None:
         self._storage_dir = storage_dir or PATHS.jobs_dir
         self._storage_dir.mkdir(parents=True, exist_ok=True)
+        # ``_jobs`` and ``_snapshot`` are never mutated in place: writers build a new dict and a new
+        # newest-first tuple and publish them with a plain assignment, so readers never take a lock
+        # and always see a consistent registry, even while iterating it.
         self._jobs: Dict[str, JobRecord] = {}
-        self._lock = threading.RLock()
+        self._snapshot: Tuple[JobRecord, ...] = ()
+        self._cancel_events: Dict[str, threading.Event] = {}
+        self._snapshot_json: Optional[Tuple[int, bytes]] = None
+        # ``_dir_lock`` guards the registry itself (jobs, snapshot, dirty set, index); the fields of
+        # a job are guarded by its shard lock, so writers on unrelated jobs never wait on each other.
+        self._dir_lock = threading.RLock()
+        self._locks = tuple(threading.RLock() for _ in range(LOCK_SHARDS))
+        self._index_lock = threading.Lock()
+        # Bumped on every mutation so readers can cheaply tell whether cached views are stale.
+        # ``next`` on a counter is atomic, so writers under different locks never reuse a value.
+        self._revisions = itertools.count(1)
+        self._revision = 0
+        # Only moves when a job is added, removed or changes status; progress ticks leave it alone.
+        self._status_revision = 0
+        # Manifests are written by a flusher thread that coalesces bursts of updates into one write;
+        # terminal status changes and process exit flush immediately.
+        self._dirty: set[str] = set()
+        # A slim copy of every manifest plus its mtime and size, mirrored into ``index.json`` so
+        # startup reads one file; a manifest that no longer matches its entry wins over the index.
+        self._index: Dict[str, Dict[str, Any]] = {}
+        # Jobs loaded from the index whose summary bodies are still only on disk.
+        self._unhydrated: set[str] = set()
+        self._index_path = self._storage_dir / "index.json"
+        self._index_dirty = False
+        self._flush_requested = threading.Event()
+        threading.Thread(target=self._flush_loop, name="transcriptor-manifests", daemon=True).start()
+        # Job directories are renamed out of the way under the lock and deleted by this worker.
+        self._delete_queue: "queue.SimpleQueue[Path]" = queue.SimpleQueue()
+        threading.Thread(target=self._delete_loop, name="transcriptor-cleanup", daemon=True).start()
+        atexit.register(self.flush)
         self._load_existing()
+        self._rebuild_snapshot()
+
+    @property
+    def revision(self) -> int:
+        return self._revision
+
+    @property
+    def status_revision(self) -> int:
+        return self._status_revision
+
+    def _lock_for(self, job_id: str) -> threading.RLock:
+        return self._locks[hash(job_id) % LOCK_SHARDS]
 
     # ------------------------------------------------------------------
     def _manifest_path(self, job_id: str) -> Path:
         return self._storage_dir / job_id / "manifest.json"
 
-    def _save_manifest(self, job: JobRecord) -> None:
-        manifest_path = self._manifest_path(job.id)
-        manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        payload: Dict[str, Any] = {
+    def _manifest_payload(self, job: JobRecord) -> Dict[str, Any]:
+        return {
             "id": job.id,
             "filename": job.filename,
             "status": job.status,
             "message": job.message,
             "progress": job.progress,
             "eta_seconds": job.eta_seconds,
-            "created_at": job.created_at.isoformat(),
-            "updated_at": job.updated_at.isoformat(),
+            "created_at": _utc_datetime(job.created_at).isoformat(),
+            "updated_at": _utc_datetime(job.updated_at).isoformat(),
+            # Raw epoch seconds, so loading needs no datetime parsing; the ISO strings stay for humans.
+            "created_ts": job.created_at,
+            "updated_ts": job.updated_at,
             "duration_seconds": job.duration_seconds,
             "language": job.language,
             "device": job.device,
@@ -110,26 +246,121 @@ class JobStore:
                 }
                 for key, artifact in job.artifacts.items()
             },
-            "metadata": job.metadata,
-            "summaries": job.summaries,
+            "metadata": dict(job.metadata),
+            "summaries": dict(job.summaries),
         }
-        manifest_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def _save_manifest(self, job: JobRecord) -> None:
+        # Called with the job's shard lock held, which also serialises writers of the same file.
+        self._hydrate_summaries(job)
+        manifest_path = self._manifest_path(job.id)
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = self._manifest_payload(job)
+        _write_json(manifest_path, payload, indent=True)
+        try:
+            entry = self._index_entry(payload, manifest_path.stat())
+        except OSError:
+            return
+        with self._dir_lock:
+            if job.id in self._jobs:
+                self._index[job.id] = entry
+                self._index_dirty = True
+
+    @staticmethod
+    def _index_entry(payload: Dict[str, Any], manifest_stat: os.stat_result) -> Dict[str, Any]:
+        entry = {key: value for key, value in payload.items() if key not in _INDEX_OMITTED}
+        summaries = payload.get("summaries")
+        entry["summary_modes"] = list(summaries) if isinstance(summaries, dict) else []
+        entry["manifest_mtime_ns"] = manifest_stat.st_mtime_ns
+        entry["manifest_size"] = manifest_stat.st_size
+        return entry
+
+    def _hydrate_summaries(self, job: JobRecord) -> None:
+        # Called with the job's shard lock held; swaps the placeholders for the stored bodies.
+        if job.id not in self._unhydrated:
+            return
+        self._unhydrated.discard(job.id)
+        try:
+            stored = _read_json(self._manifest_path(job.id)).get("summaries") or {}
+        except Exception:
+            stored = {}
+        for key, value in list(job.summaries.items()):
+            if value is not None:
+                continue
+            payload = stored.get(key)
+            if isinstance(payload, dict):
+                job.summaries[key] = payload
+            else:
+                del job.summaries[key]
+                job.version += 1
+
+    def _write_index(self) -> None:
+        with self._index_lock:
+            with self._dir_lock:
+                if not self._index_dirty:
+                    return
+                payload = {"jobs": dict(self._index)}
+                self._index_dirty = False
+            _write_json(self._index_path, payload, indent=False)
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            jobs = _read_json(self._index_path)["jobs"]
+        except Exception:
+            return {}
+        return jobs if isinstance(jobs, dict) else {}
 
     def _load_existing(self) -> None:
-        for manifest in self._storage_dir.glob("*/manifest.json"):
+        # One read of index.json replaces parsing every manifest; a directory listing plus one stat
+        # per job catches manifests written after the last index flush, added or removed by hand.
+        indexed = self._read_index()
+        stale = False
+        try:
+            job_dirs = [entry for entry in os.scandir(self._storage_dir) if entry.is_dir()]
+        except OSError:
+            job_dirs = []
+        job_ids = []
+        for entry in job_dirs:
+            if entry.name.endswith(DELETING_SUFFIX):
+                # Left behind by a deletion the previous run did not get to finish.
+                self._delete_queue.put(Path(entry.path))
+            else:
+                job_ids.append(entry.name)
+        for job_id in job_ids:
+            manifest_path = self._manifest_path(job_id)
             try:
-                data = json.loads(manifest.read_text(encoding="utf-8"))
-            except Exception:
+                manifest_stat = manifest_path.stat()
+            except OSError:
                 continue
+            entry = indexed.get(job_id)
+            if (
+                entry is None
+                or entry.get("manifest_mtime_ns") != manifest_stat.st_mtime_ns
+                or entry.get("manifest_size") != manifest_stat.st_size
+            ):
+                try:
+                    data = _read_json(manifest_path)
+                except Exception:
+                    continue
+                entry = self._index_entry(data, manifest_stat)
+                stale = True
+            else:
+                data = entry
             try:
                 record = self._record_from_manifest(data)
             except Exception:
                 continue
+            if data is entry and record.summaries:
+                self._unhydrated.add(record.id)
             self._jobs[record.id] = record
+            self._index[record.id] = entry
+        if stale or self._index.keys() != indexed.keys():
+            self._index_dirty = True
+            self._flush_requested.set()
 
     def _record_from_manifest(self, data: Dict[str, Any]) -> JobRecord:
-        created = self._parse_datetime(data.get("created_at"))
-        updated = self._parse_datetime(data.get("updated_at"))
+        created = self._manifest_timestamp(data, "created")
+        updated = self._manifest_timestamp(data, "updated")
         record = JobRecord(
             id=str(data.get("id")),
             filename=str(data.get("filename")),
@@ -149,16 +380,22 @@ class JobStore:
         artifacts = data.get("artifacts", {}) or {}
         for key, payload in artifacts.items():
             path = Path(payload.get("path", ""))
-            if not path.exists():
+            try:
+                stat_result = path.stat()
+            except OSError:
                 continue
             record.artifacts[key] = JobArtifact(
                 name=str(payload.get("name", path.name)),
                 path=path,
                 content_type=str(payload.get("content_type", "application/octet-stream")),
+                stat=stat_result,
             )
         metadata = data.get("metadata", {}) or {}
         if isinstance(metadata, dict):
             record.metadata.update(metadata)
+        if "summary_modes" in data:
+            # Index entries only carry the mode names; ``_hydrate_summaries`` fills in the bodies.
+            record.summaries.update(dict.fromkeys(data["summary_modes"] or ()))
         summaries = data.get("summaries", {}) or {}
         if isinstance(summaries, dict):
             for key, payload in summaries.items():
@@ -166,20 +403,64 @@ class JobStore:
                     record.summaries[key] = payload
         return record
 
-    @staticmethod
-    def _parse_datetime(value: Any) -> datetime:
-        if isinstance(value, datetime):
+    @classmethod
+    def _manifest_timestamp(cls, data: Dict[str, Any], name: str) -> float:
+        value = data.get(f"{name}_ts")
+        if type(value) is float:
             return value
+        # Manifests written before the epoch fields existed only carry the ISO string.
+        return cls._parse_timestamp(data.get(f"{name}_at"))
+
+    @staticmethod
+    def _parse_timestamp(value: Any) -> float:
         if isinstance(value, str):
             try:
-                return datetime.fromisoformat(value)
+                parsed = datetime.fromisoformat(value)
             except ValueError:
                 pass
-        return datetime.utcnow()
+            else:
+                if parsed.tzinfo is None:
+                    parsed = parsed.replace(tzinfo=timezone.utc)
+                return parsed.timestamp()
+        return time.time()
+
+    def _rebuild_snapshot(self) -> None:
+        self._snapshot = tuple(sorted(self._jobs.values(), key=_created_at, reverse=True))
+
+    def _publish(self, jobs: Dict[str, JobRecord], snapshot: Tuple[JobRecord, ...]) -> None:
+        # Called with ``_dir_lock`` held; the dict goes first so no snapshot entry is missing from it.
+        self._jobs = jobs
+        self._snapshot = snapshot
 
     def _touch(self, job: JobRecord) -> None:
-        job.updated_at = datetime.utcnow()
-        self._save_manifest(job)
+        job.updated_at = time.time()
+        job.version += 1
+        self._revision = next(self._revisions)
+        with self._dir_lock:
+            self._dirty.add(job.id)
+        self._flush_requested.set()
+
+    def _flush_loop(self) -> None:
+        while True:
+            self._flush_requested.wait()
+            # Let the burst that triggered the wake-up land before writing.
+            time.sleep(MANIFEST_FLUSH_INTERVAL)
+            self._flush_requested.clear()
+            try:
+                self.flush()
+            except Exception:  # pragma: no cover - keep the flusher alive
+                pass
+
+    def flush(self) -> None:
+        """Write every manifest with pending changes."""
+        with self._dir_lock:
+            dirty, self._dirty = self._dirty, set()
+        for job_id in dirty:
+            with self._lock_for(job_id):
+                job = self._jobs.get(job_id)
+                if job is not None:
+                    self._save_manifest(job)
+        self._write_index()
 
     # ------------------------------------------------------------------
     def create(
@@ -193,7 +474,7 @@ class JobStore:
         language: Optional[str],
     ) -> JobRecord:
         job_id = uuid.uuid4().hex
-        now = datetime.utcnow()
+        now = time.time()
         record = JobRecord(
             id=job_id,
             filename=filename,
@@ -206,90 +487,210 @@ class JobStore:
             vad=vad,
             beam_size=beam_size,
         )
-        with self._lock:
-            self._jobs[job_id] = record
+        with self._lock_for(job_id):
+            with self._dir_lock:
+                self._publish({**self._jobs, job_id: record}, (record,) + self._snapshot)
+            self._revision = next(self._revisions)
+            self._status_revision = next(self._revisions)
             self._save_manifest(record)
+        self._flush_requested.set()
         return record
 
     # ------------------------------------------------------------------
     def get(self, job_id: str) -> Optional[JobRecord]:
-        with self._lock:
-            return self._jobs.get(job_id)
+        # Reads whichever registry was last published; no lock needed for readers.
+        return self._jobs.get(job_id)
 
     # ------------------------------------------------------------------
     def list(self) -> List[JobRecord]:
-        with self._lock:
-            return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+        return list(self._snapshot)
+
+    def snapshot_json(self) -> bytes:
+        """Return the ``/jobs`` envelope as JSON bytes, rebuilt only after a mutation."""
+        cached = self._snapshot_json
+        if cached is not None and cached[0] == self._revision:
+            return cached[1]
+        revision = self._revision
+        # Splice the per-job encodings together: only jobs that changed since the last poll are
+        # re-encoded, the rest reuse their cached bytes.
+        parts = []
+        for job in self._snapshot:
+            with self._lock_for(job.id):
+                parts.append(job.as_json())
+        body = b'{"jobs":[' + b",".join(parts) + b"]}"
+        self._snapshot_json = (revision, body)
+        return body
 
     # ------------------------------------------------------------------
     def set_status(self, job_id: str, status: str, *, message: Optional[str] = None) -> None:
-        with self._lock:
+        with self._lock_for(job_id):
             job = self._jobs[job_id]
             job.status = status
             job.message = message
             self._touch(job)
+            self._status_revision = next(self._revisions)
+            if status in {JobStatus.COMPLETED, JobStatus.FAILED}:
+                # The manifest is written now; its index entry follows with the flusher's next batch.
+                with self._dir_lock:
+                    self._dirty.discard(job_id)
+                self._save_manifest(job)
 
     def set_progress(self, job_id: str, progress: float, eta_seconds: Optional[float] = None) -> None:
-        with self._lock:
-            job = self._jobs[job_id]
-            job.progress = max(0.0, min(progress, 100.0))
-            job.eta_seconds = eta_seconds
-            self._touch(job)
+        # Hot path, fed only by the job's own worker: plain attribute stores are atomic under the
+        # GIL, and the manifest is not rewritten for telemetry; the next status change persists it.
+        # Fields are written before the counters so any view tagged with the new revision sees them.
+        job = self._jobs[job_id]
+        job.progress = max(0.0, min(progress, 100.0))
+        job.eta_seconds = eta_seconds
+        job.updated_at = time.time()
+        job.version += 1
+        self._revision = next(self._revisions)
 
     def attach_artifact(self, job_id: str, key: str, artifact: JobArtifact) -> None:
-        with self._lock:
+        if artifact.stat is None:
+            try:
+                artifact.stat = artifact.path.stat()
+            except OSError:
+                pass
+        with self._lock_for(job_id):
             job = self._jobs[job_id]
             job.artifacts[key] = artifact
             self._touch(job)
 
     def mark_duration(self, job_id: str, duration_seconds: Optional[float]) -> None:
-        with self._lock:
+        with self._lock_for(job_id):
             job = self._jobs[job_id]
             job.duration_seconds = duration_seconds
             self._touch(job)
 
     def add_metadata(self, job_id: str, **metadata: Any) -> None:
-        with self._lock:
+        with self._lock_for(job_id):
             job = self._jobs[job_id]
             job.metadata.update(metadata)
             self._touch(job)
 
     def store_summary(self, job_id: str, mode_key: str, summary_payload: Dict[str, Any]) -> None:
-        with self._lock:
+        with self._lock_for(job_id):
             job = self._jobs[job_id]
+            self._hydrate_summaries(job)
             job.summaries[mode_key] = summary_payload
             self._touch(job)
 
     def summary(self, job_id: str, mode_key: str) -> Optional[Dict[str, Any]]:
-        with self._lock:
+        with self._lock_for(job_id):
             job = self._jobs[job_id]
+            self._hydrate_summaries(job)
             return job.summaries.get(mode_key)
 
+    # ------------------------------------------------------------------
+    def cancel_event(self, job_id: str) -> threading.Event:
+        """Return the cancel event shared by the job's worker and the cancel endpoint."""
+        with self._lock_for(job_id):
+            event = self._cancel_events.get(job_id)
+            if event is None:
+                event = self._cancel_events[job_id] = threading.Event()
+            return event
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel the job; returns ``False`` if it is already finished.
+
+        A queued job is failed on the spot, so it never depends on reaching the worker; a running
+        one is signalled through its cancel event and stopped by the worker.
+        """
+        with self._lock_for(job_id):
+            job = self._jobs[job_id]
+            if job.status == JobStatus.QUEUED:
+                job.metadata["cancelled"] = True
+                self.set_status(job_id, JobStatus.FAILED, message=CANCELLED_MESSAGE)
+                self._cancel_events.pop(job_id, None)
+                return True
+            if job.status != JobStatus.PROCESSING:
+                return False
+            self.cancel_event(job_id).set()
+            return True
+
+    def start(self, job_id: str) -> bool:
+        """Move a queued job to processing; ``False`` if it was cancelled while queued."""
+        with self._lock_for(job_id):
+            if self._jobs[job_id].status != JobStatus.QUEUED:
+                return False
+            self.set_status(job_id, JobStatus.PROCESSING, message="Procesando")
+            return True
+
+    def complete(self, job_id: str, artifacts: Dict[str, JobArtifact], *, message: str) -> bool:
+        """Attach the artifacts and mark the job completed, unless a cancel got there first.
+
+        Checked under the job's lock, so a cancel either lands before this and wins, or finds the
+        job completed and is refused.
+        """
+        for artifact in artifacts.values():
+            if artifact.stat is None:
+                try:
+                    artifact.stat = artifact.path.stat()
+                except OSError:
+                    pass
+        with self._lock_for(job_id):
+            event = self._cancel_events.get(job_id)
+            if event is not None and event.is_set():
+                return False
+            job = self._jobs[job_id]
+            job.artifacts.update(artifacts)
+            self.set_status(job_id, JobStatus.COMPLETED, message=message)
+            return True
+
+    def release_cancel_event(self, job_id: str) -> None:
+        with self._lock_for(job_id):
+            self._cancel_events.pop(job_id, None)
+
     # ------------------------------------------------------------------
     def prune(self, *, retention_days: int) -> None:
         cutoff = time.time() - (retention_days * 86400)
-        with self._lock:
-            stale_ids: List[str] = []
-            for job_id, job in list(self._jobs.items()):
-                if job.created_at.timestamp() < cutoff:
-                    stale_ids.append(job_id)
-            for job_id in stale_ids:
+        # The snapshot is ordered newest first, so the stale jobs are exactly its tail.
+        stale_ids: List[str] = []
+        for job in reversed(self._snapshot):
+            if job.created_at >= cutoff:
+                break
+            stale_ids.append(job.id)
+        for job_id in stale_ids:
+            with self._lock_for(job_id):
                 self._remove(job_id)
+        if stale_ids:
+            self._write_index()
 
     def _remove(self, job_id: str) -> None:
-        self._jobs.pop(job_id, None)
-        manifest = self._manifest_path(job_id)
-        if manifest.exists():
+        # Called with the job's shard lock held. The rename hides the directory from the next
+        # ``_load_existing`` at once; the slow recursive delete runs on the cleanup thread.
+        with self._dir_lock:
+            jobs = dict(self._jobs)
+            removed = jobs.pop(job_id, None)
+            if removed is not None:
+                self._publish(jobs, tuple(job for job in self._snapshot if job is not removed))
+            self._dirty.discard(job_id)
+            self._index.pop(job_id, None)
+            self._index_dirty = True
+        self._unhydrated.discard(job_id)
+        self._cancel_events.pop(job_id, None)
+        self._revision = next(self._revisions)
+        self._status_revision = next(self._revisions)
+        job_dir = self._manifest_path(job_id).parent
+        doomed = job_dir.with_name(job_id + DELETING_SUFFIX)
+        try:
+            job_dir.rename(doomed)
+        except FileNotFoundError:
+            return
+        except OSError:
+            # Windows refuses to rename a directory with open files (e.g. a download in flight);
+            # dropping the manifest is enough to keep the job from coming back.
             try:
-                manifest.unlink()
-            except OSError:
-                pass
-        job_dir = manifest.parent
-        if job_dir.exists():
-            try:
-                shutil.rmtree(job_dir)
+                self._manifest_path(job_id).unlink()
             except OSError:
                 pass
+            doomed = job_dir
+        self._delete_queue.put(doomed)
+
+    def _delete_loop(self) -> None:
+        while True:
+            shutil.rmtree(self._delete_queue.get(), ignore_errors=True)
 
     # ------------------------------------------------------------------
     def __iter__(self) -> Iterable[JobRecord]:
@@ -84,6 +84,10 @@ class ExportRequest(BaseModel):
     meeting_date: Optional[str] = None
 
 
+class SelfTestRequest(BaseModel):
+    model: Optional[str] = None
+
+
 class LicenseStatusPayload(BaseModel):
     active: bool
     plan: str
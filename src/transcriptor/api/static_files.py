@@ -0,0 +1,64 @@
+"""Static file serving for the exported Next.js frontend."""
+from __future__ import annotations
+
+import hashlib
+import mimetypes
+import os
+from pathlib import Path
+from typing import Dict, Tuple
+
+from fastapi.staticfiles import StaticFiles
+from starlette import status
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Scope
+
+IMMUTABLE_ASSETS_DIR = Path("_next") / "static"
+IMMUTABLE_ASSET_MAX_BYTES = 1024 * 1024
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class CachedStaticFiles(StaticFiles):
+    """``StaticFiles`` that keeps the content-hashed bundle in memory.
+
+    Everything under ``_next/static`` is named after its content hash by ``next export``, so those
+    files are loaded once at startup and served without touching the disk. The HTML pages and any
+    other asset fall back to the regular ``StaticFiles`` behaviour.
+    """
+
+    def __init__(self, *, directory: str | os.PathLike[str], html: bool = False) -> None:
+        super().__init__(directory=directory, html=html)
+        self._immutable = self._preload(Path(directory))
+
+    @staticmethod
+    def _preload(root: Path) -> Dict[str, Tuple[bytes, str, str]]:
+        assets: Dict[str, Tuple[bytes, str, str]] = {}
+        assets_root = root / IMMUTABLE_ASSETS_DIR
+        if not assets_root.is_dir():
+            return assets
+        for candidate in assets_root.rglob("*"):
+            try:
+                if not candidate.is_file() or candidate.stat().st_size > IMMUTABLE_ASSET_MAX_BYTES:
+                    continue
+                data = candidate.read_bytes()
+            except OSError:
+                continue
+            content_type = mimetypes.guess_type(candidate.name)[0] or "application/octet-stream"
+            etag = f'"{hashlib.md5(data).hexdigest()}"'
+            # Keys use the same normalised form that ``StaticFiles.get_path`` hands to ``get_response``.
+            assets[os.path.normpath(candidate.relative_to(root))] = (data, content_type, etag)
+        return assets
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        cached = self._immutable.get(path)
+        if cached is None or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+        data, content_type, etag = cached
+        headers = {"cache-control": IMMUTABLE_CACHE_CONTROL, "etag": etag}
+        if_none_match = Headers(scope=scope).get("if-none-match", "")
+        if etag in {tag.strip() for tag in if_none_match.split(",")}:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(data, media_type=content_type, headers=headers)
+
+
+__all__ = ["CachedStaticFiles"]
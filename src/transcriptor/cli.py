@@ -5,18 +5,15 @@ import base64
 import json
 import sys
 import threading
+from importlib import import_module
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import typer
-from rich import print
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 PACKAGE_ROOT = Path(__file__).resolve().parent.parent
-fastapi_app = None  # type: ignore[assignment]
-_api_import_error: Optional[Exception] = None
+# FastAPI, the tray launcher, the JWT helpers and rich are heavy to import, so each command imports
+# what it needs; ``transcriptor version`` and friends start without them.
 
 
 if __package__ in (None, ""):
@@ -26,35 +23,15 @@ if __package__ in (None, ""):
     from transcriptor import __version__  # type: ignore
     from transcriptor.disclaimer import DISCLAIMER_TEXT  # type: ignore
     from transcriptor.license import issue_license, load_license, save_license, verify_license  # type: ignore
-    from transcriptor.license_tokens import decode_token, issue_token  # type: ignore
-    from transcriptor.license_service import LicenseManager  # type: ignore
-    from transcriptor.launcher import run_launcher  # type: ignore
     from transcriptor.config import ConfigManager, PATHS  # type: ignore
     from transcriptor.constants import API_HOST, API_PORT  # type: ignore
-
-    try:
-        from transcriptor.api import app as _fastapi_app  # type: ignore
-    except Exception as exc:  # pragma: no cover - defensive feedback
-        _api_import_error = exc
-    else:
-        fastapi_app = _fastapi_app
 else:
     from . import __version__
     from .disclaimer import DISCLAIMER_TEXT
     from .license import issue_license, load_license, save_license, verify_license
-    from .license_tokens import decode_token, issue_token
-    from .license_service import LicenseManager
-    from .launcher import run_launcher
     from .config import ConfigManager, PATHS
     from .constants import API_HOST, API_PORT
 
-    try:
-        from .api import app as _fastapi_app
-    except Exception as exc:  # pragma: no cover - defensive feedback
-        _api_import_error = exc
-    else:
-        fastapi_app = _fastapi_app
-
 if "API_HOST" not in globals():  # pragma: no cover - defensive default during packaging
     API_HOST = "127.0.0.1"
     API_PORT = 4814
@@ -63,7 +40,20 @@ app = typer.Typer(add_completion=False, help="Herramientas administrativas para
 doctor_app = typer.Typer(help="Diagnóstico y mantenimiento")
 app.add_typer(doctor_app, name="doctor")
 
-console = Console()
+
+def _import(name: str) -> Any:
+    # Deferred imports follow the same rule as the top-level ones: relative to the package, or
+    # ``transcriptor.<name>`` when the file runs as a script.
+    return import_module(f"{__package__ or 'transcriptor'}.{name}")
+
+
+def _get_fastapi_app(action: str) -> Any:
+    try:
+        fastapi_app = _import("api").app
+    except Exception as exc:  # pragma: no cover - defensive feedback
+        typer.secho(f"{action} (falta: {exc})", fg="red", err=True)
+        raise typer.Exit(code=1)
+    return fastapi_app
 
 
 def _resolve_device(device: str, provider: "ModelProvider") -> str:
@@ -89,14 +79,7 @@ def run_api(
     reload: bool = typer.Option(False, help="Activa autoreload (solo desarrollo)"),
 ) -> None:
     """Arranca el backend FastAPI local."""
-    if fastapi_app is None:
-        typer.secho(
-            "El backend FastAPI no pudo importarse. Revisa la instalación (falta:"
-            f" {_api_import_error})",
-            fg="red",
-            err=True,
-        )
-        raise typer.Exit(code=1)
+    fastapi_app = _get_fastapi_app("El backend FastAPI no pudo importarse. Revisa la instalación")
     import uvicorn
 
     uvicorn.run(fastapi_app, host=host, port=port, reload=reload, log_level="info")
@@ -105,20 +88,16 @@ def run_api(
 @app.command("launcher")
 def run_launcher_cmd() -> None:
     """Inicia el launcher con bandeja del sistema."""
-    if _api_import_error is not None:
-        typer.secho(
-            "No se puede iniciar el launcher porque el backend no cargó:"
-            f" {_api_import_error}",
-            fg="red",
-            err=True,
-        )
-        raise typer.Exit(code=1)
-    run_launcher()
+    _get_fastapi_app("No se puede iniciar el launcher porque el backend no cargó")
+    _import("launcher").run_launcher()
 
 
 @app.command("disclaimer")
 def show_disclaimer() -> None:
     """Muestra el descargo de responsabilidad que reciben los usuarios finales."""
+    from rich import print
+    from rich.panel import Panel
+
     print(Panel.fit(DISCLAIMER_TEXT, title="Descargo de responsabilidad", border_style="yellow"))
 
 
@@ -186,6 +165,9 @@ def doctor_clean_editables(
 def doctor_status() -> None:
     """Muestra la disponibilidad de CUDA, VAD y FFmpeg."""
 
+    from rich.console import Console
+    from rich.table import Table
+
     from .config import PATHS
     from .transcription import ModelProvider, Transcriber
 
@@ -203,7 +185,7 @@ def doctor_status() -> None:
     table.add_row("Directorio de modelos", str(PATHS.models_dir))
     table.add_row("Directorio de trabajos", str(PATHS.jobs_dir))
 
-    console.print(table)
+    Console().print(table)
 
 
 @doctor_app.command("autotest")
@@ -218,6 +200,10 @@ def doctor_selftest(
 ) -> None:
     """Ejecuta una transcripción de prueba e informa los resultados."""
 
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+
     from .api._selftest_audio import SELFTEST_WAV_BASE64
     from .config import PATHS
     from .transcription import ModelProvider, OutputWriter, Transcriber
@@ -264,6 +250,7 @@ def doctor_selftest(
     summary.add_row("Duración", f"{duration:.2f} s")
     summary.add_row("Tiempo de proceso", f"{result.elapsed:.2f} s")
     summary.add_row("VAD aplicado", "Sí" if result.vad_applied else "No")
+    console = Console()
     console.print(summary)
 
     preview = result.text.strip()
@@ -288,6 +275,9 @@ def cmd_issue(
     salida: Path = typer.Option(Path("licencia.json"), help="Archivo de destino"),
 ) -> None:
     """Emite una nueva licencia firmada digitalmente."""
+    from rich import print
+    from rich.panel import Panel
+
     blob = issue_license(holder=nombre, email=correo, validity_days=dias, secret=clave_secreta, note=nota or None)
     save_license(blob, salida)
     print(Panel.fit(json.dumps(blob, indent=2, ensure_ascii=False), title=f"Licencia guardada en {salida}", border_style="green"))
@@ -299,6 +289,9 @@ def cmd_verify(
     clave_secreta: str = typer.Option(..., prompt=True, hide_input=True, help="Clave secreta privada"),
 ) -> None:
     """Verifica una licencia existente."""
+    from rich import print
+    from rich.panel import Panel
+
     blob = load_license(archivo)
     if verify_license(blob, clave_secreta):
         print(Panel.fit("Licencia válida", title="Resultado", border_style="green"))
@@ -322,7 +315,10 @@ def cmd_issue_token(
     device_hash: str = typer.Option("", help="Huella concreta del dispositivo (opcional)"),
 ) -> None:
     """Genera un token de licencia firmado."""
-    token = issue_token(
+    from rich import print
+    from rich.panel import Panel
+
+    token = _import("license_tokens").issue_token(
         private_key_path=llave_privada,
         holder_email=correo,
         plan=plan,
@@ -343,14 +339,20 @@ def cmd_verify_token(
     llave_publica: Path = typer.Option(..., exists=True, help="Clave pública PEM"),
 ) -> None:
     """Verifica un token firmado y muestra su contenido."""
-    payload = decode_token(token, llave_publica)
+    from rich import print
+    from rich.panel import Panel
+
+    payload = _import("license_tokens").decode_token(token, llave_publica)
     print(Panel.fit(json.dumps(payload, indent=2, ensure_ascii=False), title="Token válido", border_style="green"))
 
 
 @app.command("licencia-estado")
 def cmd_license_status() -> None:
     """Muestra el estado de la licencia instalada en este equipo."""
-    manager = LicenseManager(ConfigManager(PATHS.config_file))
+    from rich import print
+    from rich.panel import Panel
+
+    manager = _import("license_service").LicenseManager(ConfigManager(PATHS.config_file))
     status = manager.status()
     features = "\n".join(f"- {feature}" for feature in sorted(status.features)) or "Sin features"
     body = (
@@ -367,7 +369,7 @@ def cmd_license_status() -> None:
 @app.command("version")
 def version() -> None:
     """Muestra la versión instalada."""
-    print(f"Transcriptor de FERIA v{__version__}")
+    typer.echo(f"Transcriptor de FERIA v{__version__}")
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import sysconfig
 from dataclasses import dataclass
+from fnmatch import fnmatch
 from pathlib import Path
 from typing import Iterable, Sequence
 from urllib.parse import urlparse
@@ -88,67 +90,84 @@ def _candidate_directories() -> list[Path]:
 
 
 def _scan_directory(base: Path, roots: set[Path]) -> list[Artifact]:
+    # Un único ``scandir`` por directorio: los ``DirEntry`` ya traen el tipo y los
+    # patrones se resuelven en memoria en lugar de con un ``glob`` por tipo.
+    try:
+        with os.scandir(base) as iterator:
+            entries = {entry.name: entry for entry in iterator if not entry.name.startswith(".")}
+    except OSError:  # pragma: no cover - dependiente de permisos
+        return []
     results: list[Artifact] = []
-    results.extend(_scan_egg_links(base, roots))
-    results.extend(_scan_pth_files(base, roots))
-    results.extend(_scan_dist_info(base, roots))
-    results.extend(_scan_egg_info(base))
+    results.extend(_scan_egg_links(entries, roots))
+    results.extend(_scan_pth_files(entries, roots))
+    results.extend(_scan_dist_info(entries, roots))
+    results.extend(_scan_egg_info(entries))
     return results
 
 
-def _scan_egg_links(base: Path, roots: set[Path]) -> list[Artifact]:
+def _matching(entries: dict[str, os.DirEntry[str]], pattern: str) -> list[os.DirEntry[str]]:
+    return [entry for name, entry in sorted(entries.items()) if fnmatch(name, pattern)]
+
+
+def _scan_egg_links(entries: dict[str, os.DirEntry[str]], roots: set[Path]) -> list[Artifact]:
     artifacts: list[Artifact] = []
-    for entry in base.glob("transcriptor-feria*.egg-link"):
-        target = _read_first_line(entry)
+    for entry in _matching(entries, "transcriptor-feria*.egg-link"):
+        path = Path(entry.path)
+        target = _read_first_line(path)
         target_path = _safe_path(target)
         if target_path is not None and _matches_expected(target_path, roots):
             continue
         detail = target or "(sin ruta)"
-        artifacts.append(Artifact(path=entry, kind="egg-link", detail=detail))
+        artifacts.append(Artifact(path=path, kind="egg-link", detail=detail))
     return artifacts
 
 
-def _scan_pth_files(base: Path, roots: set[Path]) -> list[Artifact]:
+def _scan_pth_files(entries: dict[str, os.DirEntry[str]], roots: set[Path]) -> list[Artifact]:
     artifacts: list[Artifact] = []
-    for entry in base.glob("*.pth"):
+    for entry in _matching(entries, "*.pth"):
+        path = Path(entry.path)
         try:
-            content = entry.read_text(encoding="utf-8")
+            content = path.read_text(encoding="utf-8")
         except OSError:  # pragma: no cover - dependiente de permisos
             continue
         if "transcriptor" not in content.lower():
             continue
         if any(str(root) in content for root in roots):
             continue
-        artifacts.append(Artifact(path=entry, kind="pth", detail="contiene referencias a transcriptor"))
+        artifacts.append(Artifact(path=path, kind="pth", detail="contiene referencias a transcriptor"))
     return artifacts
 
 
-def _scan_dist_info(base: Path, roots: set[Path]) -> list[Artifact]:
+def _scan_dist_info(entries: dict[str, os.DirEntry[str]], roots: set[Path]) -> list[Artifact]:
     artifacts: list[Artifact] = []
-    for entry in base.glob("transcriptor_feria-*.dist-info"):
-        record = entry / "RECORD"
-        direct_url = entry / "direct_url.json"
-        if record.exists():
-            target_path = _direct_url_path(direct_url)
-            if target_path is not None and _matches_expected(target_path, roots):
-                continue
-            if not direct_url.exists():
+    for entry in _matching(entries, "transcriptor_feria-*.dist-info"):
+        path = Path(entry.path)
+        try:
+            with os.scandir(entry.path) as iterator:
+                contents = {item.name for item in iterator}
+        except OSError:  # pragma: no cover - dependiente de permisos
+            contents = set()
+        if "RECORD" in contents:
+            if "direct_url.json" not in contents:
                 # Instalación en modo wheel estándar; no debe causar conflictos.
                 continue
+            target_path = _direct_url_path(path / "direct_url.json")
+            if target_path is not None and _matches_expected(target_path, roots):
+                continue
             detail = str(target_path) if target_path is not None else "direct_url ajeno"
         else:
             detail = "sin RECORD"
-        artifacts.append(Artifact(path=entry, kind="dist-info", detail=detail))
+        artifacts.append(Artifact(path=path, kind="dist-info", detail=detail))
     return artifacts
 
 
-def _scan_egg_info(base: Path) -> list[Artifact]:
+def _scan_egg_info(entries: dict[str, os.DirEntry[str]]) -> list[Artifact]:
     artifacts: list[Artifact] = []
-    for entry in base.glob("transcriptor*-*.egg-info"):
-        artifacts.append(Artifact(path=entry, kind="egg-info"))
-    legacy = base / "transcriptor-feria.egg-info"
-    if legacy.exists():
-        artifacts.append(Artifact(path=legacy, kind="egg-info"))
+    for entry in _matching(entries, "transcriptor*-*.egg-info"):
+        artifacts.append(Artifact(path=Path(entry.path), kind="egg-info"))
+    legacy = entries.get("transcriptor-feria.egg-info")
+    if legacy is not None:
+        artifacts.append(Artifact(path=Path(legacy.path), kind="egg-info"))
     return artifacts
 
 
@@ -1,6 +1,6 @@
 """Public API for the summariser package."""
 from .engine import ActionItem, SummaryDocument, SummaryOrchestrator
-from .exporters import export_document
+from .exporters import export_document, export_document_to
 from .templates import TEMPLATES, SummaryTemplate, get_template
 
 __all__ = [
@@ -8,6 +8,7 @@ __all__ = [
     "SummaryDocument",
     "SummaryOrchestrator",
     "export_document",
+    "export_document_to",
     "TEMPLATES",
     "SummaryTemplate",
     "get_template",
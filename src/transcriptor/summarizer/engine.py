@@ -14,11 +14,12 @@ logger = configure_logging()
 
 
 SENTENCE_REGEX = re.compile(r"(?<=[.!?])\s+")
+ATTENDEE_REGEX = re.compile(r"(participantes|asistentes):\s*(.*)", re.IGNORECASE)
 
 
 def _split_sentences(text: str) -> List[str]:
     cleaned = text.replace("\n", " ")
-    parts = re.split(r"(?<=[.!?])\s+", cleaned)
+    parts = SENTENCE_REGEX.split(cleaned)
     return [sentence.strip() for sentence in parts if sentence.strip()]
 
 
@@ -148,9 +149,8 @@ class LocalLLMSummariser:
         next_steps = key_points[1:4] if len(key_points) > 1 else key_points
 
         attendees: List[str] = []
-        attendee_pattern = re.compile(r"(participantes|asistentes):\s*(.*)", re.IGNORECASE)
         for sentence in sentences:
-            match = attendee_pattern.search(sentence)
+            match = ATTENDEE_REGEX.search(sentence)
             if match:
                 attendees = [name.strip() for name in re.split(r",|y", match.group(2)) if name.strip()]
                 break
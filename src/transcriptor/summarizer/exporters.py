@@ -3,12 +3,19 @@ from __future__ import annotations
 
 import io
 import json
+from pathlib import Path
 from typing import Tuple
 
 from docx import Document
 
 from .engine import SummaryDocument
 
+CONTENT_TYPES = {
+    "markdown": "text/markdown",
+    "json": "application/json",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
 
 def export_markdown(document: SummaryDocument) -> bytes:
     lines = [f"# {document.title}"]
@@ -50,7 +57,7 @@ def export_json(document: SummaryDocument) -> bytes:
     return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
 
 
-def export_docx(document: SummaryDocument) -> bytes:
+def _build_docx(document: SummaryDocument) -> Document:
     doc = Document()
     doc.add_heading(document.title, level=1)
     if document.client or document.meeting_date:
@@ -95,17 +102,34 @@ def export_docx(document: SummaryDocument) -> bytes:
     if document.fallback_used:
         doc.add_paragraph("Resumen generado en modo extractivo por limitaciones detectadas.")
 
+    return doc
+
+
+def export_docx(document: SummaryDocument) -> bytes:
     buffer = io.BytesIO()
-    doc.save(buffer)
+    _build_docx(document).save(buffer)
     return buffer.getvalue()
 
 
 def export_document(document: SummaryDocument, export_format: str) -> Tuple[bytes, str]:
     if export_format == "markdown":
-        return export_markdown(document), "text/markdown"
+        return export_markdown(document), CONTENT_TYPES["markdown"]
     if export_format == "json":
-        return export_json(document), "application/json"
+        return export_json(document), CONTENT_TYPES["json"]
     if export_format == "docx":
-        return export_docx(document), "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        return export_docx(document), CONTENT_TYPES["docx"]
     raise ValueError(f"Formato no soportado: {export_format}")
 
+
+def export_document_to(document: SummaryDocument, export_format: str, target: Path) -> str:
+    """Write the export straight to ``target`` and return its content type.
+
+    DOCX documents are saved directly to disk instead of going through an in-memory buffer.
+    """
+    if export_format == "docx":
+        _build_docx(document).save(str(target))
+        return CONTENT_TYPES["docx"]
+    content, content_type = export_document(document, export_format)
+    target.write_bytes(content)
+    return content_type
+
@@ -5,9 +5,10 @@ import gc
 import os
 import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
 
 from pydub import AudioSegment
 
@@ -330,6 +331,18 @@ class Transcriber:
         )
 
 
+@contextmanager
+def _atomic_target(path: Path) -> Iterator[Path]:
+    """Yield a temporary sibling of ``path`` that only replaces it once fully written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
 class OutputWriter:
     @staticmethod
     def _timestamp(value: float) -> str:
@@ -340,13 +353,17 @@ class OutputWriter:
         return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
 
     def write_txt(self, path: Path, text: str) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(text, encoding="utf-8")
+        with _atomic_target(path) as tmp:
+            tmp.write_text(text, encoding="utf-8")
         logger.info("TXT saved: %s", path)
 
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        with _atomic_target(path) as tmp:
+            tmp.write_bytes(data)
+        logger.info("File saved: %s", path)
+
     def write_srt(self, path: Path, segments: Iterable[Segment]) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as handle:
+        with _atomic_target(path) as tmp, tmp.open("w", encoding="utf-8") as handle:
             for index, segment in enumerate(segments, 1):
                 handle.write(
                     f"{index}\n"